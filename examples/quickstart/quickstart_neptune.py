@@ -211,8 +211,7 @@ async def main():
         )
 
         # Use a predefined search configuration recipe and modify its limit
-        node_search_config = NODE_HYBRID_SEARCH_RRF.model_copy(deep=True)
-        node_search_config.limit = 5  # Limit to 5 results
+        node_search_config = NODE_HYBRID_SEARCH_RRF.with_limit(5)  # Limit to 5 results
 
         # Execute the node search
         node_search_results = await graphiti._search(
@@ -0,0 +1,451 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from graphiti_core.edges import EntityEdge
+    from graphiti_core.nodes import CommunityNode, EntityNode
+
+logger = logging.getLogger(__name__)
+
+ENTITY_NAME_COLLECTION = 'entity_name'
+COMMUNITY_NAME_COLLECTION = 'community_name'
+EDGE_FACT_COLLECTION = 'edge_fact'
+COLLECTIONS = (ENTITY_NAME_COLLECTION, COMMUNITY_NAME_COLLECTION, EDGE_FACT_COLLECTION)
+
+INITIAL_CAPACITY = 1024
+# Collections are searched exactly until they hold this many vectors, then partitioned (IVF)
+DEFAULT_TRAIN_THRESHOLD = 4096
+DEFAULT_N_PROBE = 8
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_SIZE = 20_000
+ASSIGN_CHUNK_SIZE = 8192
+
+_VECTORS_FILE = 'vectors.npy'
+_CENTROIDS_FILE = 'centroids.npy'
+_META_FILE = 'meta.json'
+_EDGE_ENDPOINTS_FILE = 'edge_endpoints.json'
+
+
+def _normalize(vectors: NDArray[np.float32]) -> NDArray[np.float32]:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return (vectors / np.where(norms == 0, 1, norms)).astype(np.float32, copy=False)
+
+
+class _VectorCollection:
+    """
+    Unit-normalized float32 vectors for one embedding property, searched by cosine similarity.
+
+    Rows are reused after deletes. Once the collection reaches ``train_threshold`` live vectors it
+    is partitioned with spherical k-means (IVF) and queries only score the ``n_probe`` closest
+    partitions; the partitioning is retrained each time the collection doubles in size.
+    """
+
+    def __init__(self, directory: Path | None, train_threshold: int, n_probe: int):
+        self.directory = directory
+        self.train_threshold = train_threshold
+        self.n_probe = n_probe
+
+        self.dim: int | None = None
+        self._vectors: NDArray[np.float32] = np.zeros((0, 0), dtype=np.float32)
+        self._live: NDArray[np.bool_] = np.zeros(0, dtype=bool)
+        self._group_codes: NDArray[np.int32] = np.zeros(0, dtype=np.int32)
+        self._assignments: NDArray[np.int32] = np.zeros(0, dtype=np.int32)
+        self._uuids: list[str | None] = []
+        self._rows: dict[str, int] = {}
+        self._free_rows: list[int] = []
+        self._group_lookup: dict[str, int] = {}
+        self._group_names: list[str] = []
+        self._centroids: NDArray[np.float32] | None = None
+        self._trained_count = 0
+
+        if directory is not None and (directory / _META_FILE).exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self._rows
+
+    def _group_code(self, group_id: str) -> int:
+        code = self._group_lookup.get(group_id)
+        if code is None:
+            code = len(self._group_names)
+            self._group_lookup[group_id] = code
+            self._group_names.append(group_id)
+        return code
+
+    def _allocate(self, capacity: int, dim: int) -> NDArray[np.float32]:
+        """Return a zeroed ``(capacity, dim)`` array holding a copy of the current rows."""
+        old_capacity = self._vectors.shape[0]
+        if self.directory is None:
+            vectors = np.zeros((capacity, dim), dtype=np.float32)
+            if old_capacity:
+                vectors[:old_capacity] = self._vectors
+            return vectors
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / _VECTORS_FILE
+        tmp_path = self.directory / f'{_VECTORS_FILE}.tmp'
+        vectors = np.lib.format.open_memmap(
+            tmp_path, mode='w+', dtype=np.float32, shape=(capacity, dim)
+        )
+        if old_capacity:
+            vectors[:old_capacity] = self._vectors
+        vectors.flush()
+        del vectors
+        os.replace(tmp_path, path)
+        return np.lib.format.open_memmap(path, mode='r+')
+
+    def _grow(self, needed: int, dim: int) -> None:
+        capacity = self._vectors.shape[0]
+        if needed <= capacity:
+            return
+
+        new_capacity = max(INITIAL_CAPACITY, capacity * 2)
+        while new_capacity < needed:
+            new_capacity *= 2
+
+        self._vectors = self._allocate(new_capacity, dim)
+        self._live = np.concatenate([self._live, np.zeros(new_capacity - capacity, dtype=bool)])
+        self._group_codes = np.concatenate(
+            [self._group_codes, np.zeros(new_capacity - capacity, dtype=np.int32)]
+        )
+        self._assignments = np.concatenate(
+            [self._assignments, np.full(new_capacity - capacity, -1, dtype=np.int32)]
+        )
+
+    def upsert(self, uuids: list[str], group_ids: list[str], vectors: NDArray[np.float32]) -> None:
+        if len(uuids) == 0:
+            return
+
+        if self.dim is None:
+            self.dim = int(vectors.shape[1])
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(
+                f'Embedding dimension {vectors.shape[1]} does not match ANN index dimension '
+                f'{self.dim}'
+            )
+
+        rows: list[int] = []
+        for uuid in uuids:
+            row = self._rows.get(uuid)
+            if row is None:
+                row = self._free_rows.pop() if self._free_rows else len(self._uuids)
+                if row == len(self._uuids):
+                    self._uuids.append(None)
+                self._uuids[row] = uuid
+                self._rows[uuid] = row
+            rows.append(row)
+
+        self._grow(len(self._uuids), self.dim)
+
+        row_index = np.asarray(rows, dtype=np.int64)
+        normalized = _normalize(vectors)
+        self._vectors[row_index] = normalized
+        self._live[row_index] = True
+        self._group_codes[row_index] = [self._group_code(group_id) for group_id in group_ids]
+
+        if self._centroids is not None:
+            self._assignments[row_index] = np.argmax(normalized @ self._centroids.T, axis=1)
+
+        live_count = len(self._rows)
+        if live_count >= self.train_threshold and live_count >= 2 * self._trained_count:
+            self._train()
+
+    def remove(self, uuids: Iterable[str]) -> None:
+        for uuid in uuids:
+            row = self._rows.pop(uuid, None)
+            if row is None:
+                continue
+            self._uuids[row] = None
+            self._live[row] = False
+            self._assignments[row] = -1
+            self._free_rows.append(row)
+
+    def remove_group(self, group_id: str) -> None:
+        code = self._group_lookup.get(group_id)
+        if code is None:
+            return
+        rows = np.flatnonzero(self._live & (self._group_codes == code))
+        self.remove([uuid for uuid in (self._uuids[row] for row in rows) if uuid is not None])
+
+    def clear(self) -> None:
+        self.remove(list(self._rows))
+        self._centroids = None
+        self._trained_count = 0
+
+    def _train(self) -> None:
+        """Partition the live vectors with spherical k-means on a seeded sample."""
+        assert self.dim is not None
+        live_rows = np.flatnonzero(self._live)
+        n_lists = max(1, int(np.sqrt(len(live_rows))))
+
+        rng = np.random.default_rng(0)
+        sample_rows = live_rows
+        if len(live_rows) > KMEANS_SAMPLE_SIZE:
+            sample_rows = np.sort(rng.choice(live_rows, KMEANS_SAMPLE_SIZE, replace=False))
+        sample = np.asarray(self._vectors[sample_rows])
+
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)]
+        for _ in range(KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            # Empty partitions keep their previous centroid
+            filled = np.bincount(labels, minlength=n_lists) > 0
+            centroids[filled] = _normalize(sums[filled])
+
+        self._centroids = centroids
+        self._assign_live_rows(centroids)
+        self._trained_count = len(live_rows)
+
+        logger.debug(f'Trained ANN index with {n_lists} partitions over {len(live_rows)} vectors')
+
+    def _assign_live_rows(self, centroids: NDArray[np.float32]) -> None:
+        self._assignments[:] = -1
+        live_rows = np.flatnonzero(self._live)
+        for start in range(0, len(live_rows), ASSIGN_CHUNK_SIZE):
+            chunk = live_rows[start : start + ASSIGN_CHUNK_SIZE]
+            self._assignments[chunk] = np.argmax(self._vectors[chunk] @ centroids.T, axis=1)
+
+    def search(
+        self,
+        vector: list[float],
+        k: int,
+        group_ids: list[str] | None = None,
+        min_score: float = 0.0,
+    ) -> list[tuple[str, float]]:
+        if self.dim is None or len(self._rows) == 0 or k <= 0:
+            return []
+
+        query = _normalize(np.asarray(vector, dtype=np.float32))
+        size = len(self._uuids)
+        mask = self._live[:size].copy()
+
+        if group_ids is not None:
+            codes = [self._group_lookup[g] for g in group_ids if g in self._group_lookup]
+            mask &= np.isin(self._group_codes[:size], codes)
+
+        if self._centroids is not None:
+            n_probe = min(self.n_probe, len(self._centroids))
+            probed = np.argpartition(-(self._centroids @ query), n_probe - 1)[:n_probe]
+            mask &= np.isin(self._assignments[:size], probed)
+
+        rows = np.flatnonzero(mask)
+        if len(rows) == 0:
+            return []
+
+        scores = self._vectors[rows] @ query
+        keep = scores > min_score
+        rows, scores = rows[keep], scores[keep]
+        if len(rows) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            rows, scores = rows[top], scores[top]
+
+        order = np.argsort(-scores, kind='stable')
+        return [(self._uuids[rows[i]] or '', float(scores[i])) for i in order]
+
+    def flush(self) -> None:
+        if self.directory is None or self.dim is None:
+            return
+
+        if isinstance(self._vectors, np.memmap):
+            self._vectors.flush()
+        if self._centroids is not None:
+            np.save(self.directory / _CENTROIDS_FILE, self._centroids)
+        else:
+            (self.directory / _CENTROIDS_FILE).unlink(missing_ok=True)
+
+        meta = {
+            'dim': self.dim,
+            'uuids': self._uuids,
+            'group_ids': [
+                self._group_names[code] if uuid is not None else None
+                for uuid, code in zip(self._uuids, self._group_codes.tolist(), strict=False)
+            ],
+            'trained_count': self._trained_count,
+        }
+        (self.directory / _META_FILE).write_text(json.dumps(meta))
+
+    def _load(self) -> None:
+        assert self.directory is not None
+        meta = json.loads((self.directory / _META_FILE).read_text())
+        self.dim = int(meta['dim'])
+        self._uuids = meta['uuids']
+        self._trained_count = int(meta['trained_count'])
+
+        self._vectors = np.lib.format.open_memmap(self.directory / _VECTORS_FILE, mode='r+')
+        capacity = self._vectors.shape[0]
+        self._live = np.zeros(capacity, dtype=bool)
+        self._group_codes = np.zeros(capacity, dtype=np.int32)
+        self._assignments = np.full(capacity, -1, dtype=np.int32)
+
+        for row, (uuid, group_id) in enumerate(zip(self._uuids, meta['group_ids'], strict=True)):
+            if uuid is None:
+                self._free_rows.append(row)
+                continue
+            self._rows[uuid] = row
+            self._live[row] = True
+            self._group_codes[row] = self._group_code(group_id)
+
+        centroids_path = self.directory / _CENTROIDS_FILE
+        if centroids_path.exists():
+            centroids = np.load(centroids_path)
+            self._centroids = centroids
+            self._assign_live_rows(centroids)
+
+
+class ANNIndex:
+    """
+    In-process approximate nearest-neighbour index kept alongside a GraphDriver.
+
+    Intended for providers without native vector search (Kuzu, Neptune, older FalkorDB). Attach
+    it with ``driver.ann_index = ANNIndex(directory)``; saves and deletes made through the driver
+    keep it current and the similarity searches use it to pick candidate uuids, which are then
+    loaded and filtered in the database. When ``directory`` is set, vectors live in memory-mapped
+    float32 files and ``flush`` persists the row metadata so the index can be reopened.
+
+    Only writes made while the index is attached are indexed; attach it to an empty graph or
+    backfill it with the ``index_*`` methods.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        train_threshold: int = DEFAULT_TRAIN_THRESHOLD,
+        n_probe: int = DEFAULT_N_PROBE,
+    ):
+        self.directory = Path(directory) if directory is not None else None
+        self.collections = {
+            name: _VectorCollection(
+                self.directory / name if self.directory is not None else None,
+                train_threshold,
+                n_probe,
+            )
+            for name in COLLECTIONS
+        }
+        # Edge rows are dropped with their endpoints, mirroring DETACH DELETE of a node
+        self._node_edges: dict[str, set[str]] = {}
+        self._edge_endpoints: dict[str, tuple[str, str]] = {}
+
+        endpoints_path = (
+            self.directory / _EDGE_ENDPOINTS_FILE if self.directory is not None else None
+        )
+        if endpoints_path is not None and endpoints_path.exists():
+            for edge_uuid, (source, target) in json.loads(endpoints_path.read_text()).items():
+                self._link_edge(edge_uuid, source, target)
+
+    def _upsert(
+        self,
+        collection: str,
+        items: list[tuple[str, str, list[float] | None]],
+    ) -> None:
+        embedded = [(uuid, group_id, vector) for uuid, group_id, vector in items if vector]
+        # Items saved without an embedding can no longer be found by similarity
+        self.collections[collection].remove(uuid for uuid, _, vector in items if not vector)
+        if not embedded:
+            return
+
+        uuids, group_ids, vectors = zip(*embedded, strict=True)
+        self.collections[collection].upsert(
+            list(uuids), list(group_ids), np.asarray(vectors, dtype=np.float32)
+        )
+
+    def _link_edge(self, edge_uuid: str, source_uuid: str, target_uuid: str) -> None:
+        self._edge_endpoints[edge_uuid] = (source_uuid, target_uuid)
+        self._node_edges.setdefault(source_uuid, set()).add(edge_uuid)
+        self._node_edges.setdefault(target_uuid, set()).add(edge_uuid)
+
+    def index_entity_nodes(self, nodes: list['EntityNode']) -> None:
+        self._upsert(
+            ENTITY_NAME_COLLECTION,
+            [(node.uuid, node.group_id, node.name_embedding) for node in nodes],
+        )
+
+    def index_community_nodes(self, nodes: list['CommunityNode']) -> None:
+        self._upsert(
+            COMMUNITY_NAME_COLLECTION,
+            [(node.uuid, node.group_id, node.name_embedding) for node in nodes],
+        )
+
+    def index_entity_edges(self, edges: list['EntityEdge']) -> None:
+        self._upsert(
+            EDGE_FACT_COLLECTION,
+            [(edge.uuid, edge.group_id, edge.fact_embedding) for edge in edges],
+        )
+        for edge in edges:
+            if edge.uuid in self.collections[EDGE_FACT_COLLECTION]:
+                self._link_edge(edge.uuid, edge.source_node_uuid, edge.target_node_uuid)
+
+    def remove_edges(self, uuids: list[str]) -> None:
+        self.collections[EDGE_FACT_COLLECTION].remove(uuids)
+        for uuid in uuids:
+            for node_uuid in self._edge_endpoints.pop(uuid, ()):
+                self._node_edges.get(node_uuid, set()).discard(uuid)
+
+    def remove_nodes(self, uuids: list[str]) -> None:
+        self.collections[ENTITY_NAME_COLLECTION].remove(uuids)
+        self.collections[COMMUNITY_NAME_COLLECTION].remove(uuids)
+        self.remove_edges(
+            [edge_uuid for uuid in uuids for edge_uuid in self._node_edges.pop(uuid, set())]
+        )
+
+    def remove_group(self, group_id: str) -> None:
+        for collection in self.collections.values():
+            collection.remove_group(group_id)
+
+        edges = self.collections[EDGE_FACT_COLLECTION]
+        self.remove_edges([uuid for uuid in self._edge_endpoints if uuid not in edges])
+
+    def clear(self, collection: str | None = None) -> None:
+        names = COLLECTIONS if collection is None else (collection,)
+        for name in names:
+            self.collections[name].clear()
+        if EDGE_FACT_COLLECTION in names:
+            self._edge_endpoints.clear()
+            self._node_edges.clear()
+
+    def search(
+        self,
+        collection: str,
+        vector: list[float],
+        k: int,
+        group_ids: list[str] | None = None,
+        min_score: float = 0.0,
+    ) -> list[tuple[str, float]]:
+        """Return up to ``k`` ``(uuid, cosine similarity)`` pairs above ``min_score``, best first."""
+        return self.collections[collection].search(vector, k, group_ids, min_score)
+
+    def flush(self) -> None:
+        """Persist every collection and the edge endpoint map to ``directory``."""
+        if self.directory is None:
+            return
+
+        for collection in self.collections.values():
+            collection.flush()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / _EDGE_ENDPOINTS_FILE).write_text(json.dumps(self._edge_endpoints))
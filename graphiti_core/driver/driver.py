@@ -24,6 +24,7 @@ from typing import Any
 
 from dotenv import load_dotenv
 
+from graphiti_core.driver.ann_index import ANNIndex
 from graphiti_core.driver.graph_operations.graph_operations import GraphOperationsInterface
 from graphiti_core.driver.search_interface.search_interface import SearchInterface
 
@@ -77,6 +78,10 @@ class GraphDriver(ABC):
     )
     _database: str
     default_group_id: str = ''
+    # When set, native vector indexes of this dimension back the embedding similarity searches
+    vector_index_dimensions: int | None = None
+    # Optional in-process k-NN index for providers without native vector search
+    ann_index: ANNIndex | None = None
     search_interface: SearchInterface | None = None
     graph_operations_interface: GraphOperationsInterface | None = None
 
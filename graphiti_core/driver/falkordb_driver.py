@@ -34,7 +34,11 @@ else:
         ) from None
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
-from graphiti_core.graph_queries import get_fulltext_indices, get_range_indices
+from graphiti_core.graph_queries import (
+    get_fulltext_indices,
+    get_range_indices,
+    get_vector_indices,
+)
 from graphiti_core.utils.datetime_utils import convert_datetimes_to_strings
 
 logger = logging.getLogger(__name__)
@@ -125,6 +129,7 @@ class FalkorDriver(GraphDriver):
         password: str | None = None,
         falkor_db: FalkorDB | None = None,
         database: str = 'default_db',
+        vector_index_dimensions: int | None = None,
     ):
         """
         Initialize the FalkorDB driver.
@@ -140,9 +145,12 @@ class FalkorDriver(GraphDriver):
         password (str | None): The password for authentication (if required).
         falkor_db (FalkorDB | None): An existing FalkorDB instance to use instead of creating a new one.
         database (str): The name of the database to connect to. Defaults to 'default_db'.
+        vector_index_dimensions (int | None): Embedding dimension for native vector indexes on
+            entity, community and fact embeddings. When None, similarity search scans embeddings.
         """
         super().__init__()
         self._database = database
+        self.vector_index_dimensions = vector_index_dimensions
         if falkor_db is not None:
             # If a FalkorDB instance is provided, use it directly
             self.client = falkor_db
@@ -238,6 +246,19 @@ class FalkorDriver(GraphDriver):
                                 f'DROP FULLTEXT INDEX FOR ()-[e:{label}]-() ON (e.{field_name})'
                             )
                         )
+                elif 'VECTOR' in index_type:
+                    if entity_type == 'NODE':
+                        drop_tasks.append(
+                            self.execute_query(
+                                f'DROP VECTOR INDEX FOR (n:{label}) ON (n.{field_name})'
+                            )
+                        )
+                    elif entity_type == 'RELATIONSHIP':
+                        drop_tasks.append(
+                            self.execute_query(
+                                f'DROP VECTOR INDEX FOR ()-[e:{label}]-() ON (e.{field_name})'
+                            )
+                        )
 
         if drop_tasks:
             await asyncio.gather(*drop_tasks)
@@ -246,6 +267,8 @@ class FalkorDriver(GraphDriver):
         if delete_existing:
             await self.delete_all_indexes()
         index_queries = get_range_indices(self.provider) + get_fulltext_indices(self.provider)
+        if self.vector_index_dimensions is not None:
+            index_queries += get_vector_indices(self.provider, self.vector_index_dimensions)
         for query in index_queries:
             await self.execute_query(query)
 
@@ -257,11 +280,18 @@ class FalkorDriver(GraphDriver):
         if database == self._database:
             cloned = self
         elif database == self.default_group_id:
-            cloned = FalkorDriver(falkor_db=self.client)
+            cloned = FalkorDriver(
+                falkor_db=self.client, vector_index_dimensions=self.vector_index_dimensions
+            )
         else:
             # Create a new instance of FalkorDriver with the same connection but a different database
-            cloned = FalkorDriver(falkor_db=self.client, database=database)
+            cloned = FalkorDriver(
+                falkor_db=self.client,
+                database=database,
+                vector_index_dimensions=self.vector_index_dimensions,
+            )
 
+        cloned.ann_index = self.ann_index
         return cloned
 
     async def health_check(self) -> None:
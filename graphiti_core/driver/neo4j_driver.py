@@ -22,7 +22,11 @@ from neo4j import AsyncGraphDatabase, EagerResult
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
-from graphiti_core.graph_queries import get_fulltext_indices, get_range_indices
+from graphiti_core.graph_queries import (
+    get_fulltext_indices,
+    get_range_indices,
+    get_vector_indices,
+)
 from graphiti_core.helpers import semaphore_gather
 
 logger = logging.getLogger(__name__)
@@ -38,6 +42,7 @@ class Neo4jDriver(GraphDriver):
         user: str | None,
         password: str | None,
         database: str = 'neo4j',
+        vector_index_dimensions: int | None = None,
     ):
         super().__init__()
         self.client = AsyncGraphDatabase.driver(
@@ -45,6 +50,7 @@ class Neo4jDriver(GraphDriver):
             auth=(user or '', password or ''),
         )
         self._database = database
+        self.vector_index_dimensions = vector_index_dimensions
 
         # Schedule the indices and constraints to be built
         import asyncio
@@ -98,6 +104,9 @@ class Neo4jDriver(GraphDriver):
 
         index_queries: list[LiteralString] = range_indices + fulltext_indices
 
+        if self.vector_index_dimensions is not None:
+            index_queries += get_vector_indices(self.provider, self.vector_index_dimensions)
+
         await semaphore_gather(
             *[
                 self.execute_query(
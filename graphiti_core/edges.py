@@ -80,6 +80,9 @@ class Edge(BaseModel, ABC):
                 uuid=self.uuid,
             )
 
+        if driver.ann_index is not None:
+            driver.ann_index.remove_edges([self.uuid])
+
         logger.debug(f'Deleted Edge: {self.uuid}')
 
     @classmethod
@@ -114,6 +117,9 @@ class Edge(BaseModel, ABC):
                 uuids=uuids,
             )
 
+        if driver.ann_index is not None:
+            driver.ann_index.remove_edges(uuids)
+
         logger.debug(f'Deleted Edges: {uuids}')
 
     def __hash__(self):
@@ -311,6 +317,9 @@ class EntityEdge(Edge):
                 edge_data=edge_data,
             )
 
+        if driver.ann_index is not None:
+            driver.ann_index.index_entity_edges([self])
+
         logger.debug(f'Saved edge to Graph: {self.uuid}')
 
         return result
@@ -1,8 +1,11 @@
+from .cache import CachedEmbedder, EmbeddingCacheStats
 from .client import EmbedderClient
 from .openai import OpenAIEmbedder, OpenAIEmbedderConfig
 
 __all__ = [
+    'CachedEmbedder',
     'EmbedderClient',
+    'EmbeddingCacheStats',
     'OpenAIEmbedder',
     'OpenAIEmbedderConfig',
 ]
@@ -0,0 +1,176 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+from diskcache import Cache
+
+from .client import EMBEDDING_DIM, EmbedderClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_CACHE_SIZE = 10_000
+
+
+@dataclass
+class EmbeddingCacheStats:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CachedEmbedder(EmbedderClient):
+    """
+    Embedder wrapper that caches embeddings for repeated strings.
+
+    Entries are keyed on (model, embedding dim, whitespace-normalized text). Lookups go through a
+    bounded in-process LRU first and then, when ``cache_dir`` is set, an on-disk tier that stores
+    vectors as float32 bytes. Only strings missing from both tiers are sent to the wrapped
+    embedder, and ``create_batch`` sends all of them in a single provider call.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbedderClient,
+        max_size: int = DEFAULT_EMBEDDING_CACHE_SIZE,
+        cache_dir: str | None = None,
+    ):
+        self.embedder = embedder
+        self.max_size = max_size
+        self.stats = EmbeddingCacheStats()
+
+        config = getattr(embedder, 'config', None)
+        self.model: str = str(getattr(config, 'embedding_model', None) or type(embedder).__name__)
+        self.embedding_dim: int = getattr(config, 'embedding_dim', EMBEDDING_DIM)
+
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._disk: Cache | None = Cache(cache_dir) if cache_dir is not None else None
+
+    def _cache_key(self, text: str) -> str:
+        normalized = re.sub(r'\s+', ' ', text).strip()
+        payload = f'{self.model}\x00{self.embedding_dim}\x00{normalized}'
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _remember(self, key: str, embedding: list[float]) -> None:
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, keys: list[str]) -> dict[str, list[float]]:
+        if self._disk is None:
+            return {}
+
+        found: dict[str, list[float]] = {}
+        for key in keys:
+            raw = self._disk.get(key)
+            if isinstance(raw, bytes):
+                found[key] = np.frombuffer(raw, dtype=np.float32).tolist()
+        return found
+
+    def _write_disk(self, entries: dict[str, list[float]]) -> None:
+        if self._disk is None:
+            return
+
+        for key, embedding in entries.items():
+            self._disk.set(key, np.asarray(embedding, dtype=np.float32).tobytes())
+
+    async def _lookup(self, keys: list[str]) -> dict[str, list[float]]:
+        """Resolve keys from the memory tier, then the disk tier, updating hit counters."""
+        found: dict[str, list[float]] = {}
+        disk_keys: list[str] = []
+        for key in dict.fromkeys(keys):
+            embedding = self._memory.get(key)
+            if embedding is None:
+                disk_keys.append(key)
+                continue
+            self._memory.move_to_end(key)
+            found[key] = embedding
+
+        if disk_keys and self._disk is not None:
+            disk_found = await asyncio.to_thread(self._read_disk, disk_keys)
+            for key, embedding in disk_found.items():
+                self._remember(key, embedding)
+            self.stats.disk_hits += len(disk_found)
+            found.update(disk_found)
+
+        return found
+
+    async def _store(self, entries: dict[str, list[float]]) -> None:
+        for key, embedding in entries.items():
+            self._remember(key, embedding)
+        if self._disk is not None:
+            await asyncio.to_thread(self._write_disk, entries)
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        if not isinstance(input_data, str):
+            return await self.embedder.create(input_data)
+
+        key = self._cache_key(input_data)
+        cached = await self._lookup([key])
+        if key in cached:
+            self.stats.hits += 1
+            return cached[key]
+
+        self.stats.misses += 1
+        embedding = await self.embedder.create(input_data)
+        await self._store({key: embedding})
+        return embedding
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        keys = [self._cache_key(text) for text in input_data_list]
+        cached = await self._lookup(keys)
+
+        miss_texts: dict[str, str] = {}
+        for key, text in zip(keys, input_data_list, strict=True):
+            if key in cached:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+                miss_texts.setdefault(key, text)
+
+        if miss_texts:
+            embeddings = await self.embedder.create_batch(list(miss_texts.values()))
+            fetched = dict(zip(miss_texts.keys(), embeddings, strict=True))
+            await self._store(fetched)
+            cached.update(fetched)
+
+        logger.debug(
+            f'Embedding cache batch: {len(input_data_list) - len(miss_texts)} cached, '
+            f'{len(miss_texts)} sent to provider'
+        )
+
+        return [cached[key] for key in keys]
+
+    def clear(self) -> None:
+        """Drop every cached embedding from both tiers."""
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
@@ -23,6 +23,15 @@ INDEX_TO_LABEL_KUZU_MAPPING = {
     'episode_content': 'Episodic',
     'edge_name_and_fact': 'RelatesToNode_',
 }
+# Mapping from vector index names to the (label or relationship type, property) they cover
+VECTOR_INDEX_TARGETS = {
+    'entity_name_embedding': ('Entity', 'name_embedding'),
+    'community_name_embedding': ('Community', 'name_embedding'),
+    'relates_to_fact_embedding': ('RELATES_TO', 'fact_embedding'),
+}
+# How many nearest neighbours to fetch per requested result before group and filter
+# predicates are applied to the k-NN candidates
+VECTOR_SEARCH_CANDIDATE_MULTIPLIER = 10
 
 
 def get_range_indices(provider: GraphProvider) -> list[LiteralString]:
@@ -127,6 +136,75 @@ def get_fulltext_indices(provider: GraphProvider) -> list[LiteralString]:
     ]
 
 
+def get_vector_indices(provider: GraphProvider, dimensions: int) -> list[LiteralString]:
+    """Vector index DDL for entity, community and fact embeddings using cosine similarity."""
+    from typing import cast
+
+    if provider == GraphProvider.FALKORDB:
+        options = f"{{dimension: {dimensions}, similarityFunction: 'cosine'}}"
+        return cast(
+            list[LiteralString],
+            [
+                f'CREATE VECTOR INDEX FOR (n:Entity) ON (n.name_embedding) OPTIONS {options}',
+                f'CREATE VECTOR INDEX FOR (n:Community) ON (n.name_embedding) OPTIONS {options}',
+                f'CREATE VECTOR INDEX FOR ()-[e:RELATES_TO]-() ON (e.fact_embedding) OPTIONS {options}',
+            ],
+        )
+
+    if provider != GraphProvider.NEO4J:
+        return []
+
+    options = (
+        f'{{indexConfig: {{`vector.dimensions`: {dimensions}, '
+        f"`vector.similarity_function`: 'cosine'}}}}"
+    )
+    return cast(
+        list[LiteralString],
+        [
+            f"""CREATE VECTOR INDEX entity_name_embedding IF NOT EXISTS
+            FOR (n:Entity) ON n.name_embedding OPTIONS {options}""",
+            f"""CREATE VECTOR INDEX community_name_embedding IF NOT EXISTS
+            FOR (n:Community) ON n.name_embedding OPTIONS {options}""",
+            f"""CREATE VECTOR INDEX relates_to_fact_embedding IF NOT EXISTS
+            FOR ()-[e:RELATES_TO]-() ON e.fact_embedding OPTIONS {options}""",
+        ],
+    )
+
+
+def get_vector_nodes_query(name: str, provider: GraphProvider, node_var: str = 'n') -> str:
+    """k-NN lookup yielding ``node_var`` and a ``score`` on the same scale as
+    :func:`get_vector_cosine_func_query`. Expects ``$vector_k`` and ``$search_vector``."""
+    if provider == GraphProvider.FALKORDB:
+        label, prop = VECTOR_INDEX_TARGETS[name]
+        # FalkorDB yields the cosine distance, which is mapped back to normalized similarity
+        return (
+            f"CALL db.idx.vector.queryNodes('{label}', '{prop}', $vector_k, vecf32($search_vector)) "
+            f'YIELD node AS {node_var}, score AS distance '
+            f'WITH {node_var}, (2 - distance)/2 AS score'
+        )
+
+    return (
+        f"CALL db.index.vector.queryNodes('{name}', $vector_k, $search_vector) "
+        f'YIELD node AS {node_var}, score WITH {node_var}, score'
+    )
+
+
+def get_vector_relationships_query(name: str, provider: GraphProvider) -> str:
+    """k-NN lookup yielding ``e``, its endpoints ``n`` and ``m``, and a normalized ``score``."""
+    if provider == GraphProvider.FALKORDB:
+        label, prop = VECTOR_INDEX_TARGETS[name]
+        return (
+            f"CALL db.idx.vector.queryRelationships('{label}', '{prop}', $vector_k, "
+            'vecf32($search_vector)) YIELD relationship AS e, score AS distance '
+            'WITH e, startNode(e) AS n, endNode(e) AS m, (2 - distance)/2 AS score'
+        )
+
+    return (
+        f"CALL db.index.vector.queryRelationships('{name}', $vector_k, $search_vector) "
+        'YIELD relationship AS e, score WITH e, startNode(e) AS n, endNode(e) AS m, score'
+    )
+
+
 def get_nodes_query(name: str, query: str, limit: int, provider: GraphProvider) -> str:
     if provider == GraphProvider.FALKORDB:
         label = NEO4J_TO_FALKORDB_MAPPING[name]
@@ -150,13 +228,15 @@ def get_vector_cosine_func_query(vec1, vec2, provider: GraphProvider) -> str:
     return f'vector.similarity.cosine({vec1}, {vec2})'
 
 
-def get_relationships_query(name: str, limit: int, provider: GraphProvider) -> str:
+def get_relationships_query(
+    name: str, limit: int, provider: GraphProvider, query: str = '$query'
+) -> str:
     if provider == GraphProvider.FALKORDB:
         label = NEO4J_TO_FALKORDB_MAPPING[name]
-        return f"CALL db.idx.fulltext.queryRelationships('{label}', $query)"
+        return f"CALL db.idx.fulltext.queryRelationships('{label}', {query})"
 
     if provider == GraphProvider.KUZU:
         label = INDEX_TO_LABEL_KUZU_MAPPING[name]
-        return f"CALL QUERY_FTS_INDEX('{label}', '{name}', cast($query AS STRING), TOP := $limit)"
+        return f"CALL QUERY_FTS_INDEX('{label}', '{name}', cast({query} AS STRING), TOP := $limit)"
 
-    return f'CALL db.index.fulltext.queryRelationships("{name}", $query, {{limit: $limit}})'
+    return f'CALL db.index.fulltext.queryRelationships("{name}", {query}, {{limit: $limit}})'
@@ -316,6 +316,8 @@ class Graphiti:
             finally:
                 graphiti.close()
         """
+        if self.driver.ann_index is not None:
+            self.driver.ann_index.flush()
         await self.driver.close()
 
     async def build_indices_and_constraints(self, delete_existing: bool = False):
@@ -1092,8 +1094,7 @@ class Graphiti:
         """
         search_config = (
             EDGE_HYBRID_SEARCH_RRF if center_node_uuid is None else EDGE_HYBRID_SEARCH_NODE_DISTANCE
-        )
-        search_config.limit = num_results
+        ).with_limit(num_results)
 
         edges = (
             await search(
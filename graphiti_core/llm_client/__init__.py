@@ -14,9 +14,17 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from .cache import LLMCacheBackend, LLMResponseCache
 from .client import LLMClient
 from .config import LLMConfig
 from .errors import RateLimitError
 from .openai_client import OpenAIClient
 
-__all__ = ['LLMClient', 'OpenAIClient', 'LLMConfig', 'RateLimitError']
+__all__ = [
+    'LLMCacheBackend',
+    'LLMClient',
+    'LLMResponseCache',
+    'OpenAIClient',
+    'LLMConfig',
+    'RateLimitError',
+]
@@ -0,0 +1,172 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import copy
+import logging
+import typing
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from diskcache import Cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_CACHE_SIZE = 1024
+UNKNOWN_PROMPT_NAME = 'unknown'
+
+CachedResponse = dict[str, typing.Any]
+
+
+class LLMCacheBackend(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> CachedResponse | None:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: CachedResponse) -> None:
+        pass
+
+
+class MemoryCacheBackend(LLMCacheBackend):
+    """Bounded in-process LRU of responses."""
+
+    def __init__(self, max_size: int = DEFAULT_MEMORY_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    async def get(self, key: str) -> CachedResponse | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: CachedResponse) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class DiskCacheBackend(LLMCacheBackend):
+    """diskcache-backed tier whose blocking I/O runs in a worker thread, off the event loop."""
+
+    def __init__(self, directory: str):
+        self._cache = Cache(directory)
+
+    async def get(self, key: str) -> CachedResponse | None:
+        value = await asyncio.to_thread(self._cache.get, key)
+        return value if isinstance(value, dict) else None
+
+    async def set(self, key: str, value: CachedResponse) -> None:
+        await asyncio.to_thread(self._cache.set, key, value)
+
+
+class TieredCacheBackend(LLMCacheBackend):
+    """Check a fast tier before a slow one, promoting slow-tier hits into the fast tier."""
+
+    def __init__(self, fast: LLMCacheBackend, slow: LLMCacheBackend):
+        self.fast = fast
+        self.slow = slow
+
+    async def get(self, key: str) -> CachedResponse | None:
+        value = await self.fast.get(key)
+        if value is not None:
+            return value
+
+        value = await self.slow.get(key)
+        if value is not None:
+            await self.fast.set(key, value)
+        return value
+
+    async def set(self, key: str, value: CachedResponse) -> None:
+        await self.fast.set(key, value)
+        await self.slow.set(key, value)
+
+
+@dataclass
+class PromptCacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+
+class LLMResponseCache:
+    """
+    Response cache with single-flight request coalescing.
+
+    Concurrent callers asking for the same key while a response is being generated wait for that
+    generation instead of issuing their own provider call. Hits, misses and coalesced calls are
+    counted per prompt name.
+    """
+
+    def __init__(self, backend: LLMCacheBackend):
+        self.backend = backend
+        self.stats: dict[str, PromptCacheStats] = {}
+        self._in_flight: dict[str, asyncio.Future[CachedResponse]] = {}
+
+    def _stats_for(self, prompt_name: str | None) -> PromptCacheStats:
+        return self.stats.setdefault(prompt_name or UNKNOWN_PROMPT_NAME, PromptCacheStats())
+
+    async def get_or_generate(
+        self,
+        key: str,
+        generate: Callable[[], Awaitable[CachedResponse]],
+        prompt_name: str | None = None,
+    ) -> tuple[CachedResponse, bool]:
+        """Return ``(response, served_from_cache)``, calling ``generate`` at most once per key."""
+        stats = self._stats_for(prompt_name)
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            stats.coalesced += 1
+            return copy.deepcopy(await asyncio.shield(in_flight)), True
+
+        future: asyncio.Future[CachedResponse] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            cached = await self.backend.get(key)
+            if cached is not None:
+                logger.debug(f'Cache hit for {key}')
+                stats.hits += 1
+                future.set_result(cached)
+                return copy.deepcopy(cached), True
+
+            stats.misses += 1
+            response = await generate()
+            # Waiters and the cache share a snapshot so callers can safely mutate their copy.
+            snapshot = copy.deepcopy(response)
+            future.set_result(snapshot)
+            await self.backend.set(key, snapshot)
+            return response, False
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+                # Mark the exception as retrieved so a future nobody awaited does not log a warning.
+                future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
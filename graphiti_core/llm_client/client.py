@@ -21,12 +21,18 @@ import typing
 from abc import ABC, abstractmethod
 
 import httpx
-from diskcache import Cache
 from pydantic import BaseModel
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 from ..prompts.models import Message
 from ..tracer import NoOpTracer, Tracer
+from .cache import (
+    DiskCacheBackend,
+    LLMCacheBackend,
+    LLMResponseCache,
+    MemoryCacheBackend,
+    TieredCacheBackend,
+)
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError
 
@@ -64,7 +70,12 @@ def is_server_or_retry_error(exception):
 
 
 class LLMClient(ABC):
-    def __init__(self, config: LLMConfig | None, cache: bool = False):
+    def __init__(
+        self,
+        config: LLMConfig | None,
+        cache: bool = False,
+        cache_backend: LLMCacheBackend | None = None,
+    ):
         if config is None:
             config = LLMConfig()
 
@@ -74,12 +85,15 @@ class LLMClient(ABC):
         self.temperature = config.temperature
         self.max_tokens = config.max_tokens
         self.cache_enabled = cache
-        self.cache_dir = None
+        self.response_cache: LLMResponseCache | None = None
         self.tracer: Tracer = NoOpTracer()
 
         # Only create the cache directory if caching is enabled
         if self.cache_enabled:
-            self.cache_dir = Cache(DEFAULT_CACHE_DIR)
+            self.response_cache = LLMResponseCache(
+                cache_backend
+                or TieredCacheBackend(MemoryCacheBackend(), DiskCacheBackend(DEFAULT_CACHE_DIR))
+            )
 
     def set_tracer(self, tracer: Tracer) -> None:
         """Set the tracer for this LLM client."""
@@ -111,11 +125,13 @@ class LLMClient(ABC):
         stop=stop_after_attempt(4),
         wait=wait_random_exponential(multiplier=10, min=5, max=120),
         retry=retry_if_exception(is_server_or_retry_error),
-        after=lambda retry_state: logger.warning(
-            f'Retrying {retry_state.fn.__name__ if retry_state.fn else "function"} after {retry_state.attempt_number} attempts...'
-        )
-        if retry_state.attempt_number > 1
-        else None,
+        after=lambda retry_state: (
+            logger.warning(
+                f'Retrying {retry_state.fn.__name__ if retry_state.fn else "function"} after {retry_state.attempt_number} attempts...'
+            )
+            if retry_state.attempt_number > 1
+            else None
+        ),
         reraise=True,
     )
     async def _generate_response_with_retry(
@@ -184,32 +200,25 @@ class LLMClient(ABC):
                 attributes['prompt.name'] = prompt_name
             span.add_attributes(attributes)
 
-            # Check cache first
-            if self.cache_enabled and self.cache_dir is not None:
-                cache_key = self._get_cache_key(messages)
-                cached_response = self.cache_dir.get(cache_key)
-                if cached_response is not None:
-                    logger.debug(f'Cache hit for {cache_key}')
-                    span.add_attributes({'cache.hit': True})
-                    return cached_response
-
-            span.add_attributes({'cache.hit': False})
-
-            # Execute LLM call
-            try:
-                response = await self._generate_response_with_retry(
-                    messages, response_model, max_tokens, model_size
-                )
-            except Exception as e:
-                span.set_status('error', str(e))
-                span.record_exception(e)
-                raise
-
-            # Cache response if enabled
-            if self.cache_enabled and self.cache_dir is not None:
-                cache_key = self._get_cache_key(messages)
-                self.cache_dir.set(cache_key, response)
-
+            async def _generate() -> dict[str, typing.Any]:
+                try:
+                    return await self._generate_response_with_retry(
+                        messages, response_model, max_tokens, model_size
+                    )
+                except Exception as e:
+                    span.set_status('error', str(e))
+                    span.record_exception(e)
+                    raise
+
+            if self.response_cache is None:
+                span.add_attributes({'cache.hit': False})
+                return await _generate()
+
+            # Identical in-flight prompts share a single provider call
+            response, cache_hit = await self.response_cache.get_or_generate(
+                self._get_cache_key(messages), _generate, prompt_name
+            )
+            span.add_attributes({'cache.hit': cache_hit})
             return response
 
     def _get_provider_type(self) -> str:
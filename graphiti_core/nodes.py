@@ -147,6 +147,9 @@ class Node(BaseModel, ABC):
                         uuid=self.uuid,
                     )
 
+        if driver.ann_index is not None:
+            driver.ann_index.remove_nodes([self.uuid])
+
         logger.debug(f'Deleted Node: {self.uuid}')
 
     def __hash__(self):
@@ -213,6 +216,9 @@ class Node(BaseModel, ABC):
                         group_id=group_id,
                     )
 
+        if driver.ann_index is not None:
+            driver.ann_index.remove_group(group_id)
+
     @classmethod
     async def delete_by_uuids(cls, driver: GraphDriver, uuids: list[str], batch_size: int = 100):
         if driver.graph_operations_interface:
@@ -285,6 +291,9 @@ class Node(BaseModel, ABC):
                         batch_size=batch_size,
                     )
 
+        if driver.ann_index is not None:
+            driver.ann_index.remove_nodes(uuids)
+
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str): ...
 
@@ -503,6 +512,9 @@ class EntityNode(Node):
                 entity_data=entity_data,
             )
 
+        if driver.ann_index is not None:
+            driver.ann_index.index_entity_nodes([self])
+
         logger.debug(f'Saved Node to Graph: {self.uuid}')
 
         return result
@@ -608,6 +620,9 @@ class CommunityNode(Node):
             created_at=self.created_at,
         )
 
+        if driver.ann_index is not None:
+            driver.ann_index.index_community_nodes([self])
+
         logger.debug(f'Saved Node to Graph: {self.uuid}')
 
         return result
@@ -16,7 +16,9 @@ limitations under the License.
 
 import logging
 from collections import defaultdict
+from collections.abc import Coroutine
 from time import time
+from typing import Any, TypeVar
 
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.driver.driver import GraphDriver
@@ -48,7 +50,9 @@ from graphiti_core.search.search_utils import (
     community_similarity_search,
     edge_bfs_search,
     edge_fulltext_search,
+    edge_fulltext_search_many,
     edge_similarity_search,
+    edge_similarity_search_many,
     episode_fulltext_search,
     episode_mentions_reranker,
     get_embeddings_for_communities,
@@ -58,12 +62,38 @@ from graphiti_core.search.search_utils import (
     node_bfs_search,
     node_distance_reranker,
     node_fulltext_search,
+    node_fulltext_search_many,
     node_similarity_search,
+    node_similarity_search_many,
     rrf,
 )
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+
+def _requires_query_vector(config: SearchConfig) -> bool:
+    return bool(
+        config.edge_config
+        and EdgeSearchMethod.cosine_similarity in config.edge_config.search_methods
+        or config.edge_config
+        and EdgeReranker.mmr == config.edge_config.reranker
+        or config.node_config
+        and NodeSearchMethod.cosine_similarity in config.node_config.search_methods
+        or config.node_config
+        and NodeReranker.mmr == config.node_config.reranker
+        or (
+            config.community_config
+            and CommunitySearchMethod.cosine_similarity in config.community_config.search_methods
+        )
+        or (config.community_config and CommunityReranker.mmr == config.community_config.reranker)
+    )
+
+
+async def _prefetched(results: T) -> T:
+    return results
+
 
 async def search(
     clients: GraphitiClients,
@@ -85,21 +115,7 @@ async def search(
     if query.strip() == '':
         return SearchResults()
 
-    if (
-        config.edge_config
-        and EdgeSearchMethod.cosine_similarity in config.edge_config.search_methods
-        or config.edge_config
-        and EdgeReranker.mmr == config.edge_config.reranker
-        or config.node_config
-        and NodeSearchMethod.cosine_similarity in config.node_config.search_methods
-        or config.node_config
-        and NodeReranker.mmr == config.node_config.reranker
-        or (
-            config.community_config
-            and CommunitySearchMethod.cosine_similarity in config.community_config.search_methods
-        )
-        or (config.community_config and CommunityReranker.mmr == config.community_config.reranker)
-    ):
+    if _requires_query_vector(config):
         search_vector = (
             query_vector
             if query_vector is not None
@@ -110,6 +126,157 @@ async def search(
 
     # if group_ids is empty, set it to None
     group_ids = group_ids if group_ids and group_ids != [''] else None
+    results = await _search_with_vector(
+        driver,
+        cross_encoder,
+        query,
+        search_vector,
+        group_ids,
+        config,
+        search_filter,
+        center_node_uuid,
+        bfs_origin_node_uuids,
+    )
+
+    latency = (time() - start) * 1000
+
+    logger.debug(f'search returned context for query {query} in {latency} ms')
+
+    return results
+
+
+async def search_many(
+    clients: GraphitiClients,
+    queries: list[str],
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    query_vectors: list[list[float]] | None = None,
+    driver: GraphDriver | None = None,
+) -> list[SearchResults]:
+    """Run the same search for several queries at once.
+
+    All query embeddings are created with a single ``create_batch`` call and the fulltext and
+    cosine similarity lookups for nodes and edges are sent to the driver as one query per
+    method. Reranking is still done per query. Results are returned in the same order as
+    ``queries``.
+    """
+    start = time()
+
+    if query_vectors is not None and len(query_vectors) != len(queries):
+        raise ValueError('query_vectors must contain one vector per query')
+
+    driver = driver or clients.driver
+    embedder = clients.embedder
+    cross_encoder = clients.cross_encoder
+
+    results: list[SearchResults] = [SearchResults() for _ in queries]
+    active_indices = [idx for idx, query in enumerate(queries) if query.strip() != '']
+    if len(active_indices) == 0:
+        return results
+
+    active_queries = [queries[idx] for idx in active_indices]
+
+    if not _requires_query_vector(config):
+        search_vectors = [[0.0] * EMBEDDING_DIM for _ in active_queries]
+    elif query_vectors is not None:
+        search_vectors = [query_vectors[idx] for idx in active_indices]
+    else:
+        search_vectors = await embedder.create_batch(
+            [query.replace('\n', ' ') for query in active_queries]
+        )
+
+    # if group_ids is empty, set it to None
+    group_ids = group_ids if group_ids and group_ids != [''] else None
+
+    edge_prefetch_tasks: dict[EdgeSearchMethod, Coroutine[Any, Any, list[list[EntityEdge]]]] = {}
+    if config.edge_config is not None:
+        if EdgeSearchMethod.bm25 in config.edge_config.search_methods:
+            edge_prefetch_tasks[EdgeSearchMethod.bm25] = edge_fulltext_search_many(
+                driver, active_queries, search_filter, group_ids, 2 * config.limit
+            )
+        if EdgeSearchMethod.cosine_similarity in config.edge_config.search_methods:
+            edge_prefetch_tasks[EdgeSearchMethod.cosine_similarity] = edge_similarity_search_many(
+                driver,
+                search_vectors,
+                search_filter,
+                group_ids,
+                2 * config.limit,
+                config.edge_config.sim_min_score,
+            )
+
+    node_prefetch_tasks: dict[NodeSearchMethod, Coroutine[Any, Any, list[list[EntityNode]]]] = {}
+    if config.node_config is not None:
+        if NodeSearchMethod.bm25 in config.node_config.search_methods:
+            node_prefetch_tasks[NodeSearchMethod.bm25] = node_fulltext_search_many(
+                driver, active_queries, search_filter, group_ids, 2 * config.limit
+            )
+        if NodeSearchMethod.cosine_similarity in config.node_config.search_methods:
+            node_prefetch_tasks[NodeSearchMethod.cosine_similarity] = node_similarity_search_many(
+                driver,
+                search_vectors,
+                search_filter,
+                group_ids,
+                2 * config.limit,
+                config.node_config.sim_min_score,
+            )
+
+    prefetched_lists = await semaphore_gather(
+        *edge_prefetch_tasks.values(), *node_prefetch_tasks.values()
+    )
+    edge_prefetched: dict[EdgeSearchMethod, list[list[EntityEdge]]] = dict(
+        zip(edge_prefetch_tasks, prefetched_lists[: len(edge_prefetch_tasks)], strict=True)
+    )
+    node_prefetched: dict[NodeSearchMethod, list[list[EntityNode]]] = dict(
+        zip(node_prefetch_tasks, prefetched_lists[len(edge_prefetch_tasks) :], strict=True)
+    )
+
+    active_results: list[SearchResults] = await semaphore_gather(
+        *[
+            _search_with_vector(
+                driver,
+                cross_encoder,
+                query,
+                search_vector,
+                group_ids,
+                config,
+                search_filter,
+                edge_prefetched={
+                    method: method_results[i] for method, method_results in edge_prefetched.items()
+                },
+                node_prefetched={
+                    method: method_results[i] for method, method_results in node_prefetched.items()
+                },
+            )
+            for i, (query, search_vector) in enumerate(
+                zip(active_queries, search_vectors, strict=True)
+            )
+        ]
+    )
+
+    for idx, result in zip(active_indices, active_results, strict=True):
+        results[idx] = result
+
+    latency = (time() - start) * 1000
+
+    logger.debug(f'search_many returned context for {len(queries)} queries in {latency} ms')
+
+    return results
+
+
+async def _search_with_vector(
+    driver: GraphDriver,
+    cross_encoder: CrossEncoderClient,
+    query: str,
+    search_vector: list[float],
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+    edge_prefetched: dict[EdgeSearchMethod, list[EntityEdge]] | None = None,
+    node_prefetched: dict[NodeSearchMethod, list[EntityNode]] | None = None,
+) -> SearchResults:
     (
         (edges, edge_reranker_scores),
         (nodes, node_reranker_scores),
@@ -128,6 +295,7 @@ async def search(
             bfs_origin_node_uuids,
             config.limit,
             config.reranker_min_score,
+            prefetched_results=edge_prefetched,
         ),
         node_search(
             driver,
@@ -141,6 +309,7 @@ async def search(
             bfs_origin_node_uuids,
             config.limit,
             config.reranker_min_score,
+            prefetched_results=node_prefetched,
         ),
         episode_search(
             driver,
@@ -165,7 +334,7 @@ async def search(
         ),
     )
 
-    results = SearchResults(
+    return SearchResults(
         edges=edges,
         edge_reranker_scores=edge_reranker_scores,
         nodes=nodes,
@@ -176,12 +345,6 @@ async def search(
         community_reranker_scores=community_reranker_scores,
     )
 
-    latency = (time() - start) * 1000
-
-    logger.debug(f'search returned context for query {query} in {latency} ms')
-
-    return results
-
 
 async def edge_search(
     driver: GraphDriver,
@@ -195,17 +358,24 @@ async def edge_search(
     bfs_origin_node_uuids: list[str] | None = None,
     limit=DEFAULT_SEARCH_LIMIT,
     reranker_min_score: float = 0,
+    prefetched_results: dict[EdgeSearchMethod, list[EntityEdge]] | None = None,
 ) -> tuple[list[EntityEdge], list[float]]:
     if config is None:
         return [], []
 
+    prefetched_results = prefetched_results or {}
+
     # Build search tasks based on configured search methods
     search_tasks = []
-    if EdgeSearchMethod.bm25 in config.search_methods:
+    if EdgeSearchMethod.bm25 in prefetched_results:
+        search_tasks.append(_prefetched(prefetched_results[EdgeSearchMethod.bm25]))
+    elif EdgeSearchMethod.bm25 in config.search_methods:
         search_tasks.append(
             edge_fulltext_search(driver, query, search_filter, group_ids, 2 * limit)
         )
-    if EdgeSearchMethod.cosine_similarity in config.search_methods:
+    if EdgeSearchMethod.cosine_similarity in prefetched_results:
+        search_tasks.append(_prefetched(prefetched_results[EdgeSearchMethod.cosine_similarity]))
+    elif EdgeSearchMethod.cosine_similarity in config.search_methods:
         search_tasks.append(
             edge_similarity_search(
                 driver,
@@ -265,6 +435,7 @@ async def edge_search(
             search_result_uuids_and_vectors,
             config.mmr_lambda,
             reranker_min_score,
+            top_k=limit if config.mmr_greedy else None,
         )
     elif config.reranker == EdgeReranker.cross_encoder:
         fact_to_uuid_map = {edge.fact: edge.uuid for edge in list(edge_uuid_map.values())[:limit]}
@@ -318,17 +489,24 @@ async def node_search(
     bfs_origin_node_uuids: list[str] | None = None,
     limit=DEFAULT_SEARCH_LIMIT,
     reranker_min_score: float = 0,
+    prefetched_results: dict[NodeSearchMethod, list[EntityNode]] | None = None,
 ) -> tuple[list[EntityNode], list[float]]:
     if config is None:
         return [], []
 
+    prefetched_results = prefetched_results or {}
+
     # Build search tasks based on configured search methods
     search_tasks = []
-    if NodeSearchMethod.bm25 in config.search_methods:
+    if NodeSearchMethod.bm25 in prefetched_results:
+        search_tasks.append(_prefetched(prefetched_results[NodeSearchMethod.bm25]))
+    elif NodeSearchMethod.bm25 in config.search_methods:
         search_tasks.append(
             node_fulltext_search(driver, query, search_filter, group_ids, 2 * limit)
         )
-    if NodeSearchMethod.cosine_similarity in config.search_methods:
+    if NodeSearchMethod.cosine_similarity in prefetched_results:
+        search_tasks.append(_prefetched(prefetched_results[NodeSearchMethod.cosine_similarity]))
+    elif NodeSearchMethod.cosine_similarity in config.search_methods:
         search_tasks.append(
             node_similarity_search(
                 driver,
@@ -386,6 +564,7 @@ async def node_search(
             search_result_uuids_and_vectors,
             config.mmr_lambda,
             reranker_min_score,
+            top_k=limit if config.mmr_greedy else None,
         )
     elif config.reranker == NodeReranker.cross_encoder:
         name_to_uuid_map = {node.name: node.uuid for node in list(node_uuid_map.values())}
@@ -504,7 +683,11 @@ async def community_search(
         )
 
         reranked_uuids, community_scores = maximal_marginal_relevance(
-            query_vector, search_result_uuids_and_vectors, config.mmr_lambda, reranker_min_score
+            query_vector,
+            search_result_uuids_and_vectors,
+            config.mmr_lambda,
+            reranker_min_score,
+            top_k=limit if config.mmr_greedy else None,
         )
     elif config.reranker == CommunityReranker.cross_encoder:
         name_to_uuid_map = {node.name: node.uuid for result in search_results for node in result}
@@ -16,7 +16,7 @@ limitations under the License.
 
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from graphiti_core.edges import EntityEdge
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
@@ -78,22 +78,30 @@ class CommunityReranker(Enum):
 
 
 class EdgeSearchConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     search_methods: list[EdgeSearchMethod]
     reranker: EdgeReranker = Field(default=EdgeReranker.rrf)
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
     mmr_lambda: float = Field(default=DEFAULT_MMR_LAMBDA)
+    mmr_greedy: bool = Field(default=False)
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
 
 
 class NodeSearchConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     search_methods: list[NodeSearchMethod]
     reranker: NodeReranker = Field(default=NodeReranker.rrf)
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
     mmr_lambda: float = Field(default=DEFAULT_MMR_LAMBDA)
+    mmr_greedy: bool = Field(default=False)
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
 
 
 class EpisodeSearchConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     search_methods: list[EpisodeSearchMethod]
     reranker: EpisodeReranker = Field(default=EpisodeReranker.rrf)
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
@@ -102,14 +110,21 @@ class EpisodeSearchConfig(BaseModel):
 
 
 class CommunitySearchConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     search_methods: list[CommunitySearchMethod]
     reranker: CommunityReranker = Field(default=CommunityReranker.rrf)
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
     mmr_lambda: float = Field(default=DEFAULT_MMR_LAMBDA)
+    mmr_greedy: bool = Field(default=False)
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
 
 
 class SearchConfig(BaseModel):
+    # Configs are immutable so the shared recipes can be used by concurrent searches. Use
+    # with_limit or model_copy(update=...) to derive a per-call variant.
+    model_config = ConfigDict(frozen=True)
+
     edge_config: EdgeSearchConfig | None = Field(default=None)
     node_config: NodeSearchConfig | None = Field(default=None)
     episode_config: EpisodeSearchConfig | None = Field(default=None)
@@ -117,6 +132,15 @@ class SearchConfig(BaseModel):
     limit: int = Field(default=DEFAULT_SEARCH_LIMIT)
     reranker_min_score: float = Field(default=0)
 
+    def with_limit(self, limit: int) -> 'SearchConfig':
+        """Return this config with a different result limit.
+
+        The copy is shallow, so the sub-configs are shared with the original.
+        """
+        if limit == self.limit:
+            return self
+        return self.model_copy(update={'limit': limit})
+
 
 class SearchResults(BaseModel):
     edges: list[EntityEdge] = Field(default_factory=list)
@@ -57,11 +57,13 @@ COMBINED_HYBRID_SEARCH_MMR = SearchConfig(
     edge_config=EdgeSearchConfig(
         search_methods=[EdgeSearchMethod.bm25, EdgeSearchMethod.cosine_similarity],
         reranker=EdgeReranker.mmr,
+        mmr_greedy=True,
         mmr_lambda=1,
     ),
     node_config=NodeSearchConfig(
         search_methods=[NodeSearchMethod.bm25, NodeSearchMethod.cosine_similarity],
         reranker=NodeReranker.mmr,
+        mmr_greedy=True,
         mmr_lambda=1,
     ),
     episode_config=EpisodeSearchConfig(
@@ -73,6 +75,7 @@ COMBINED_HYBRID_SEARCH_MMR = SearchConfig(
     community_config=CommunitySearchConfig(
         search_methods=[CommunitySearchMethod.bm25, CommunitySearchMethod.cosine_similarity],
         reranker=CommunityReranker.mmr,
+        mmr_greedy=True,
         mmr_lambda=1,
     ),
 )
@@ -120,6 +123,7 @@ EDGE_HYBRID_SEARCH_MMR = SearchConfig(
     edge_config=EdgeSearchConfig(
         search_methods=[EdgeSearchMethod.bm25, EdgeSearchMethod.cosine_similarity],
         reranker=EdgeReranker.mmr,
+        mmr_greedy=True,
     )
 )
 
@@ -165,6 +169,7 @@ NODE_HYBRID_SEARCH_MMR = SearchConfig(
     node_config=NodeSearchConfig(
         search_methods=[NodeSearchMethod.bm25, NodeSearchMethod.cosine_similarity],
         reranker=NodeReranker.mmr,
+        mmr_greedy=True,
     )
 )
 
@@ -210,6 +215,7 @@ COMMUNITY_HYBRID_SEARCH_MMR = SearchConfig(
     community_config=CommunitySearchConfig(
         search_methods=[CommunitySearchMethod.bm25, CommunitySearchMethod.cosine_similarity],
         reranker=CommunityReranker.mmr,
+        mmr_greedy=True,
     )
 )
 
@@ -20,22 +20,28 @@ from time import time
 from typing import Any
 
 import numpy as np
-from numpy._typing import NDArray
 from typing_extensions import LiteralString
 
+from graphiti_core.driver.ann_index import (
+    COMMUNITY_NAME_COLLECTION,
+    EDGE_FACT_COLLECTION,
+    ENTITY_NAME_COLLECTION,
+)
 from graphiti_core.driver.driver import (
     GraphDriver,
     GraphProvider,
 )
 from graphiti_core.edges import EntityEdge, get_entity_edge_from_record
 from graphiti_core.graph_queries import (
+    VECTOR_SEARCH_CANDIDATE_MULTIPLIER,
     get_nodes_query,
     get_relationships_query,
     get_vector_cosine_func_query,
+    get_vector_nodes_query,
+    get_vector_relationships_query,
 )
 from graphiti_core.helpers import (
     lucene_sanitize,
-    normalize_l2,
     semaphore_gather,
 )
 from graphiti_core.models.edges.edge_db_queries import get_entity_edge_return_query
@@ -336,7 +342,27 @@ async def edge_similarity_search(
     if driver.provider == GraphProvider.KUZU:
         search_vector_var = f'CAST($search_vector AS FLOAT[{len(search_vector)}])'
 
-    if driver.provider == GraphProvider.NEPTUNE:
+    if driver.ann_index is not None:
+        candidates = _ann_candidates(
+            driver, EDGE_FACT_COLLECTION, search_vector, group_ids, limit, min_score
+        )
+        if not candidates:
+            return []
+
+        filter_params['candidate_uuids'] = list(candidates)
+        query = (
+            match_query
+            + ' WHERE '
+            + ' AND '.join(['e.uuid IN $candidate_uuids'] + filter_queries)
+            + """
+            RETURN DISTINCT
+            """
+            + get_entity_edge_return_query(driver.provider)
+        )
+
+        records, _, _ = await driver.execute_query(query, routing_='r', **filter_params)
+        records = _rank_by_candidate_score(records, candidates, limit)
+    elif driver.provider == GraphProvider.NEPTUNE:
         query = (
             """
                             MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
@@ -398,6 +424,31 @@ async def edge_similarity_search(
             )
         else:
             return []
+    elif _uses_vector_index(driver):
+        query = (
+            get_vector_relationships_query('relates_to_fact_embedding', driver.provider)
+            + filter_query
+            + """
+            WITH e, n, m, score
+            WHERE score > $min_score
+            RETURN
+            """
+            + get_entity_edge_return_query(driver.provider)
+            + """
+            ORDER BY score DESC
+            LIMIT $limit
+            """
+        )
+
+        records, _, _ = await driver.execute_query(
+            query,
+            search_vector=search_vector,
+            vector_k=limit * VECTOR_SEARCH_CANDIDATE_MULTIPLIER,
+            limit=limit,
+            min_score=min_score,
+            routing_='r',
+            **filter_params,
+        )
     else:
         query = (
             match_query
@@ -675,7 +726,28 @@ async def node_similarity_search(
     if driver.provider == GraphProvider.KUZU:
         search_vector_var = f'CAST($search_vector AS FLOAT[{len(search_vector)}])'
 
-    if driver.provider == GraphProvider.NEPTUNE:
+    if driver.ann_index is not None:
+        candidates = _ann_candidates(
+            driver, ENTITY_NAME_COLLECTION, search_vector, group_ids, limit, min_score
+        )
+        if not candidates:
+            return []
+
+        filter_params['candidate_uuids'] = list(candidates)
+        query = (
+            """
+            MATCH (n:Entity)
+            WHERE """
+            + ' AND '.join(['n.uuid IN $candidate_uuids'] + filter_queries)
+            + """
+            RETURN
+            """
+            + get_entity_node_return_query(driver.provider)
+        )
+
+        records, _, _ = await driver.execute_query(query, routing_='r', **filter_params)
+        records = _rank_by_candidate_score(records, candidates, limit)
+    elif driver.provider == GraphProvider.NEPTUNE:
         query = (
             """
                                                                                                                                     MATCH (n:Entity)
@@ -730,6 +802,31 @@ async def node_similarity_search(
             )
         else:
             return []
+    elif _uses_vector_index(driver):
+        query = (
+            get_vector_nodes_query('entity_name_embedding', driver.provider)
+            + filter_query
+            + """
+            WITH n, score
+            WHERE score > $min_score
+            RETURN
+            """
+            + get_entity_node_return_query(driver.provider)
+            + """
+            ORDER BY score DESC
+            LIMIT $limit
+            """
+        )
+
+        records, _, _ = await driver.execute_query(
+            query,
+            search_vector=search_vector,
+            vector_k=limit * VECTOR_SEARCH_CANDIDATE_MULTIPLIER,
+            limit=limit,
+            min_score=min_score,
+            routing_='r',
+            **filter_params,
+        )
     else:
         query = (
             """
@@ -1034,7 +1131,27 @@ async def community_similarity_search(
         group_filter_query += ' WHERE c.group_id IN $group_ids'
         query_params['group_ids'] = group_ids
 
-    if driver.provider == GraphProvider.NEPTUNE:
+    if driver.ann_index is not None:
+        candidates = _ann_candidates(
+            driver, COMMUNITY_NAME_COLLECTION, search_vector, group_ids, limit, min_score
+        )
+        if not candidates:
+            return []
+
+        query = (
+            """
+            MATCH (c:Community)
+            WHERE c.uuid IN $candidate_uuids
+            RETURN
+            """
+            + COMMUNITY_NODE_RETURN
+        )
+
+        records, _, _ = await driver.execute_query(
+            query, candidate_uuids=list(candidates), routing_='r'
+        )
+        records = _rank_by_candidate_score(records, candidates, limit)
+    elif driver.provider == GraphProvider.NEPTUNE:
         query = (
             """
                                                                                                                                     MATCH (n:Community)
@@ -1090,6 +1207,31 @@ async def community_similarity_search(
             )
         else:
             return []
+    elif _uses_vector_index(driver):
+        query = (
+            get_vector_nodes_query('community_name_embedding', driver.provider, node_var='c')
+            + group_filter_query
+            + """
+            WITH c, score
+            WHERE score > $min_score
+            RETURN
+            """
+            + COMMUNITY_NODE_RETURN
+            + """
+            ORDER BY score DESC
+            LIMIT $limit
+            """
+        )
+
+        records, _, _ = await driver.execute_query(
+            query,
+            search_vector=search_vector,
+            vector_k=limit * VECTOR_SEARCH_CANDIDATE_MULTIPLIER,
+            limit=limit,
+            min_score=min_score,
+            routing_='r',
+            **query_params,
+        )
     else:
         search_vector_var = '$search_vector'
         if driver.provider == GraphProvider.KUZU:
@@ -1129,6 +1271,393 @@ async def community_similarity_search(
     return communities
 
 
+def _supports_batched_search(driver: GraphDriver) -> bool:
+    # Kuzu cannot take a per-row fulltext query and Neptune routes fulltext through OpenSearch,
+    # so those providers (and custom search interfaces) fall back to one query per search.
+    return driver.search_interface is None and driver.provider not in (
+        GraphProvider.KUZU,
+        GraphProvider.NEPTUNE,
+    )
+
+
+def _uses_vector_index(driver: GraphDriver) -> bool:
+    # Kuzu's vector extension needs fixed-size array columns that cannot be SET once indexed,
+    # and Neptune scores embeddings client-side, so only Neo4j and FalkorDB use k-NN indexes.
+    return driver.vector_index_dimensions is not None and driver.provider in (
+        GraphProvider.NEO4J,
+        GraphProvider.FALKORDB,
+    )
+
+
+def _ann_candidates(
+    driver: GraphDriver,
+    collection: str,
+    search_vector: list[float],
+    group_ids: list[str] | None,
+    limit: int,
+    min_score: float,
+) -> dict[str, float]:
+    assert driver.ann_index is not None
+    # Oversample so candidates dropped by SearchFilters predicates still leave `limit` results
+    return dict(
+        driver.ann_index.search(
+            collection,
+            search_vector,
+            limit * VECTOR_SEARCH_CANDIDATE_MULTIPLIER,
+            group_ids,
+            min_score,
+        )
+    )
+
+
+def _rank_by_candidate_score(
+    records: list[Any], candidates: dict[str, float], limit: int
+) -> list[Any]:
+    return sorted(records, key=lambda record: candidates[record['uuid']], reverse=True)[:limit]
+
+
+def _split_records_by_query(records: list[Any], query_count: int) -> list[list[Any]]:
+    records_by_query: list[list[Any]] = [[] for _ in range(query_count)]
+    for record in records:
+        records_by_query[record['query_idx']].append(record)
+
+    return records_by_query
+
+
+async def node_fulltext_search_many(
+    driver: GraphDriver,
+    queries: list[str],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+) -> list[list[EntityNode]]:
+    """Run a fulltext node search for each query in a single round-trip.
+
+    Returns one result list per query, in the same order as ``queries``.
+    """
+    if len(queries) == 0:
+        return []
+
+    if not _supports_batched_search(driver):
+        return list(
+            await semaphore_gather(
+                *[
+                    node_fulltext_search(driver, query, search_filter, group_ids, limit)
+                    for query in queries
+                ]
+            )
+        )
+
+    query_params = [
+        {'idx': idx, 'fulltext_query': fulltext_query(query, group_ids, driver)}
+        for idx, query in enumerate(queries)
+    ]
+    query_params = [params for params in query_params if params['fulltext_query'] != '']
+    if len(query_params) == 0:
+        return [[] for _ in queries]
+
+    filter_queries, filter_params = node_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+
+    if group_ids is not None:
+        filter_queries.append('n.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    query = (
+        """
+        UNWIND $queries AS q
+        """
+        + get_nodes_query(
+            'node_name_and_summary', 'q.fulltext_query', limit=limit, provider=driver.provider
+        )
+        + """
+        YIELD node AS n, score
+        """
+        + filter_query
+        + """
+        WITH q, n, score
+        ORDER BY score DESC
+        WITH q, collect(n)[..$limit] AS matches
+        UNWIND matches AS n
+        RETURN
+            q.idx AS query_idx,
+        """
+        + get_entity_node_return_query(driver.provider)
+    )
+
+    records, _, _ = await driver.execute_query(
+        query,
+        queries=query_params,
+        limit=limit,
+        routing_='r',
+        **filter_params,
+    )
+
+    return [
+        [get_entity_node_from_record(record, driver.provider) for record in query_records]
+        for query_records in _split_records_by_query(records, len(queries))
+    ]
+
+
+async def node_similarity_search_many(
+    driver: GraphDriver,
+    search_vectors: list[list[float]],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+) -> list[list[EntityNode]]:
+    """Run a cosine similarity node search for each vector in a single round-trip.
+
+    Returns one result list per vector, in the same order as ``search_vectors``.
+    """
+    if len(search_vectors) == 0:
+        return []
+
+    if (
+        not _supports_batched_search(driver)
+        or _uses_vector_index(driver)
+        or driver.ann_index is not None
+    ):
+        return list(
+            await semaphore_gather(
+                *[
+                    node_similarity_search(
+                        driver, search_vector, search_filter, group_ids, limit, min_score
+                    )
+                    for search_vector in search_vectors
+                ]
+            )
+        )
+
+    filter_queries, filter_params = node_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+
+    if group_ids is not None:
+        filter_queries.append('n.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    query = (
+        """
+        UNWIND $queries AS q
+        MATCH (n:Entity)
+        """
+        + filter_query
+        + """
+        WITH q, n, """
+        + get_vector_cosine_func_query('n.name_embedding', 'q.search_vector', driver.provider)
+        + """ AS score
+        WHERE score > $min_score
+        WITH q, n, score
+        ORDER BY score DESC
+        WITH q, collect(n)[..$limit] AS matches
+        UNWIND matches AS n
+        RETURN
+            q.idx AS query_idx,
+        """
+        + get_entity_node_return_query(driver.provider)
+    )
+
+    records, _, _ = await driver.execute_query(
+        query,
+        queries=[
+            {'idx': idx, 'search_vector': search_vector}
+            for idx, search_vector in enumerate(search_vectors)
+        ],
+        limit=limit,
+        min_score=min_score,
+        routing_='r',
+        **filter_params,
+    )
+
+    return [
+        [get_entity_node_from_record(record, driver.provider) for record in query_records]
+        for query_records in _split_records_by_query(records, len(search_vectors))
+    ]
+
+
+async def edge_fulltext_search_many(
+    driver: GraphDriver,
+    queries: list[str],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+) -> list[list[EntityEdge]]:
+    """Run a fulltext edge search for each query in a single round-trip.
+
+    Returns one result list per query, in the same order as ``queries``.
+    """
+    if len(queries) == 0:
+        return []
+
+    if not _supports_batched_search(driver):
+        return list(
+            await semaphore_gather(
+                *[
+                    edge_fulltext_search(driver, query, search_filter, group_ids, limit)
+                    for query in queries
+                ]
+            )
+        )
+
+    query_params = [
+        {'idx': idx, 'fulltext_query': fulltext_query(query, group_ids, driver)}
+        for idx, query in enumerate(queries)
+    ]
+    query_params = [params for params in query_params if params['fulltext_query'] != '']
+    if len(query_params) == 0:
+        return [[] for _ in queries]
+
+    filter_queries, filter_params = edge_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+
+    if group_ids is not None:
+        filter_queries.append('e.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    query = (
+        """
+        UNWIND $queries AS q
+        """
+        + get_relationships_query(
+            'edge_name_and_fact', limit=limit, provider=driver.provider, query='q.fulltext_query'
+        )
+        + """
+        YIELD relationship AS rel, score
+        MATCH (n:Entity)-[e:RELATES_TO {uuid: rel.uuid}]->(m:Entity)
+        """
+        + filter_query
+        + """
+        WITH q, e, score
+        ORDER BY score DESC
+        WITH q, collect(e)[..$limit] AS matches
+        UNWIND matches AS e
+        WITH q, e, startNode(e) AS n, endNode(e) AS m
+        RETURN
+            q.idx AS query_idx,
+        """
+        + get_entity_edge_return_query(driver.provider)
+    )
+
+    records, _, _ = await driver.execute_query(
+        query,
+        queries=query_params,
+        limit=limit,
+        routing_='r',
+        **filter_params,
+    )
+
+    return [
+        [get_entity_edge_from_record(record, driver.provider) for record in query_records]
+        for query_records in _split_records_by_query(records, len(queries))
+    ]
+
+
+async def edge_similarity_search_many(
+    driver: GraphDriver,
+    search_vectors: list[list[float]],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+) -> list[list[EntityEdge]]:
+    """Run a cosine similarity edge search for each vector in a single round-trip.
+
+    Returns one result list per vector, in the same order as ``search_vectors``.
+    """
+    if len(search_vectors) == 0:
+        return []
+
+    if (
+        not _supports_batched_search(driver)
+        or _uses_vector_index(driver)
+        or driver.ann_index is not None
+    ):
+        return list(
+            await semaphore_gather(
+                *[
+                    edge_similarity_search(
+                        driver,
+                        search_vector,
+                        None,
+                        None,
+                        search_filter,
+                        group_ids,
+                        limit,
+                        min_score,
+                    )
+                    for search_vector in search_vectors
+                ]
+            )
+        )
+
+    filter_queries, filter_params = edge_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+
+    if group_ids is not None:
+        filter_queries.append('e.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    query = (
+        """
+        UNWIND $queries AS q
+        MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
+        """
+        + filter_query
+        + """
+        WITH DISTINCT q, e, """
+        + get_vector_cosine_func_query('e.fact_embedding', 'q.search_vector', driver.provider)
+        + """ AS score
+        WHERE score > $min_score
+        WITH q, e, score
+        ORDER BY score DESC
+        WITH q, collect(e)[..$limit] AS matches
+        UNWIND matches AS e
+        WITH q, e, startNode(e) AS n, endNode(e) AS m
+        RETURN
+            q.idx AS query_idx,
+        """
+        + get_entity_edge_return_query(driver.provider)
+    )
+
+    records, _, _ = await driver.execute_query(
+        query,
+        queries=[
+            {'idx': idx, 'search_vector': search_vector}
+            for idx, search_vector in enumerate(search_vectors)
+        ],
+        limit=limit,
+        min_score=min_score,
+        routing_='r',
+        **filter_params,
+    )
+
+    return [
+        [get_entity_edge_from_record(record, driver.provider) for record in query_records]
+        for query_records in _split_records_by_query(records, len(search_vectors))
+    ]
+
+
 async def hybrid_node_search(
     queries: list[str],
     embeddings: list[list[float]],
@@ -1840,39 +2369,59 @@ def maximal_marginal_relevance(
     candidates: dict[str, list[float]],
     mmr_lambda: float = DEFAULT_MMR_LAMBDA,
     min_score: float = -2.0,
+    top_k: int | None = None,
 ) -> tuple[list[str], list[float]]:
-    start = time()
-    query_array = np.array(query_vector)
-    candidate_arrays: dict[str, NDArray] = {}
-    for uuid, embedding in candidates.items():
-        candidate_arrays[uuid] = normalize_l2(embedding)
-
-    uuids: list[str] = list(candidate_arrays.keys())
+    """Rerank candidates by maximal marginal relevance.
 
-    similarity_matrix = np.zeros((len(uuids), len(uuids)))
-
-    for i, uuid_1 in enumerate(uuids):
-        for j, uuid_2 in enumerate(uuids[:i]):
-            u = candidate_arrays[uuid_1]
-            v = candidate_arrays[uuid_2]
-            similarity = np.dot(u, v)
-
-            similarity_matrix[i, j] = similarity
-            similarity_matrix[j, i] = similarity
+    By default every candidate is scored once against its most similar other candidate. When
+    ``top_k`` is set, results are instead selected greedily: each step picks the candidate with
+    the best trade-off between query relevance and similarity to the results already selected,
+    and selection stops after ``top_k`` results, so only k rows of similarities are computed.
+    """
+    start = time()
+    if not candidates:
+        return [], []
 
-    mmr_scores: dict[str, float] = {}
-    for i, uuid in enumerate(uuids):
-        max_sim = np.max(similarity_matrix[i, :])
-        mmr = mmr_lambda * np.dot(query_array, candidate_arrays[uuid]) + (mmr_lambda - 1) * max_sim
-        mmr_scores[uuid] = mmr
+    query_array = np.array(query_vector)
+    uuids: list[str] = list(candidates.keys())
+    candidate_matrix = np.array(list(candidates.values()), dtype=np.float64)
+    norms = np.linalg.norm(candidate_matrix, axis=1, keepdims=True)
+    candidate_matrix = np.divide(
+        candidate_matrix, norms, out=candidate_matrix.copy(), where=norms != 0
+    )
+    relevance = candidate_matrix @ query_array
 
-    uuids.sort(reverse=True, key=lambda c: mmr_scores[c])
+    if top_k is None:
+        similarity_matrix = candidate_matrix @ candidate_matrix.T
+        np.fill_diagonal(similarity_matrix, 0)
+        mmr_scores = mmr_lambda * relevance + (mmr_lambda - 1) * similarity_matrix.max(axis=1)
+        order = np.argsort(-mmr_scores, kind='stable')
+    else:
+        selected: list[int] = []
+        selected_scores: list[float] = []
+        remaining = np.ones(len(uuids), dtype=bool)
+        redundancy = np.zeros(len(uuids))
+        for _ in range(min(top_k, len(uuids))):
+            step_scores = np.where(
+                remaining, mmr_lambda * relevance + (mmr_lambda - 1) * redundancy, -np.inf
+            )
+            best = int(np.argmax(step_scores))
+            selected.append(best)
+            selected_scores.append(float(step_scores[best]))
+            remaining[best] = False
+            similarities = candidate_matrix @ candidate_matrix[best]
+            redundancy = (
+                similarities if len(selected) == 1 else np.maximum(redundancy, similarities)
+            )
+        order = np.array(selected, dtype=np.int64)
+        mmr_scores = np.zeros(len(uuids))
+        mmr_scores[order] = selected_scores
 
     end = time()
     logger.debug(f'Completed MMR reranking in {(end - start) * 1000} ms')
 
-    return [uuid for uuid in uuids if mmr_scores[uuid] >= min_score], [
-        mmr_scores[uuid] for uuid in uuids if mmr_scores[uuid] >= min_score
+    return [uuids[i] for i in order if mmr_scores[i] >= min_score], [
+        float(mmr_scores[i]) for i in order if mmr_scores[i] >= min_score
     ]
 
 
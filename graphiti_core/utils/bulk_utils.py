@@ -43,10 +43,9 @@ from graphiti_core.models.nodes.node_db_queries import (
 from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
 from graphiti_core.utils.datetime_utils import convert_datetimes_to_strings
 from graphiti_core.utils.maintenance.dedup_helpers import (
-    DedupResolutionState,
-    _build_candidate_indexes,
-    _normalize_string_exact,
-    _resolve_with_similarity,
+    DedupCandidateIndexes,
+    _name_band_keys,
+    _normalize_name_for_fuzzy,
 )
 from graphiti_core.utils.maintenance.edge_operations import (
     extract_edges,
@@ -64,6 +63,7 @@ from graphiti_core.utils.maintenance.node_operations import (
 logger = logging.getLogger(__name__)
 
 CHUNK_SIZE = 10
+EMBEDDING_BATCH_SIZE = 256
 
 
 def _build_directed_uuid_map(pairs: list[tuple[str, str]]) -> dict[str, str]:
@@ -125,6 +125,41 @@ async def retrieve_previous_episodes_bulk(
     return episode_tuples
 
 
+async def _embed_in_chunks(embedder: EmbedderClient, texts: list[str]) -> list[list[float]]:
+    chunks = [
+        texts[i : i + EMBEDDING_BATCH_SIZE] for i in range(0, len(texts), EMBEDDING_BATCH_SIZE)
+    ]
+    results: list[list[list[float]]] = await semaphore_gather(
+        *[embedder.create_batch(chunk) for chunk in chunks]
+    )
+    return [embedding for chunk in results for embedding in chunk]
+
+
+async def create_missing_embeddings(
+    embedder: EmbedderClient,
+    entity_nodes: list[EntityNode],
+    entity_edges: list[EntityEdge],
+):
+    """Fill missing name and fact embeddings with batched provider calls.
+
+    Nodes and edges are embedded with one ``create_batch`` call per type, split into chunks of
+    ``EMBEDDING_BATCH_SIZE`` to respect provider request limits.
+    """
+    missing_nodes = [node for node in entity_nodes if node.name_embedding is None]
+    missing_edges = [edge for edge in entity_edges if edge.fact_embedding is None]
+    if not missing_nodes and not missing_edges:
+        return
+
+    name_embeddings, fact_embeddings = await semaphore_gather(
+        _embed_in_chunks(embedder, [node.name.replace('\n', ' ') for node in missing_nodes]),
+        _embed_in_chunks(embedder, [edge.fact.replace('\n', ' ') for edge in missing_edges]),
+    )
+    for node, name_embedding in zip(missing_nodes, name_embeddings, strict=True):
+        node.name_embedding = name_embedding
+    for edge, fact_embedding in zip(missing_edges, fact_embeddings, strict=True):
+        edge.fact_embedding = fact_embedding
+
+
 async def add_nodes_and_edges_bulk(
     driver: GraphDriver,
     episodic_nodes: list[EpisodicNode],
@@ -133,6 +168,9 @@ async def add_nodes_and_edges_bulk(
     entity_edges: list[EntityEdge],
     embedder: EmbedderClient,
 ):
+    # Embed everything up front so the write transaction is not held open across provider calls
+    await create_missing_embeddings(embedder, entity_nodes, entity_edges)
+
     session = driver.session()
     try:
         await session.execute_write(
@@ -162,12 +200,12 @@ async def add_nodes_and_edges_bulk_tx(
         episode['source'] = str(episode['source'].value)
         episode.pop('labels', None)
 
+    # No-op when the caller already embedded the batch, as add_nodes_and_edges_bulk does
+    await create_missing_embeddings(embedder, entity_nodes, entity_edges)
+
     nodes = []
 
     for node in entity_nodes:
-        if node.name_embedding is None:
-            await node.generate_name_embedding(embedder)
-
         entity_data: dict[str, Any] = {
             'uuid': node.uuid,
             'name': node.name,
@@ -188,8 +226,6 @@ async def add_nodes_and_edges_bulk_tx(
 
     edges = []
     for edge in entity_edges:
-        if edge.fact_embedding is None:
-            await edge.generate_embedding(embedder)
         edge_data: dict[str, Any] = {
             'uuid': edge.uuid,
             'source_node_uuid': edge.source_node_uuid,
@@ -250,6 +286,11 @@ async def add_nodes_and_edges_bulk_tx(
             entity_edges=edges,
         )
 
+    if driver.ann_index is not None:
+        # Upserts are idempotent, so a retried transaction re-indexes the same rows
+        driver.ann_index.index_entity_nodes(entity_nodes)
+        driver.ann_index.index_entity_edges(entity_edges)
+
 
 async def extract_nodes_and_edges_bulk(
     clients: GraphitiClients,
@@ -323,50 +364,25 @@ async def dedupe_nodes_bulk(
         per_episode_uuid_maps.append(uuid_map)
         duplicate_pairs.extend((source.uuid, target.uuid) for source, target in duplicates)
 
+    # The canonical pool is indexed incrementally so each node is matched with a dict lookup for
+    # exact names and an LSH probe for fuzzy names, keeping this pass linear in the batch size.
+    # MinHash band keys for every node are computed up front as a single matrix.
+    batch_nodes = [node for _, resolved_nodes in episode_resolutions for node in resolved_nodes]
+    batch_band_keys = _name_band_keys(
+        [_normalize_name_for_fuzzy(node.name) for node in batch_nodes]
+    )
     canonical_nodes: dict[str, EntityNode] = {}
-    for _, resolved_nodes in episode_resolutions:
-        for node in resolved_nodes:
-            # NOTE: this loop is O(n^2) in the number of nodes inside the batch because we rebuild
-            # the MinHash index for the accumulated canonical pool each time. The LRU-backed
-            # shingle cache keeps the constant factors low for typical batch sizes (≤ CHUNK_SIZE),
-            # but if batches grow significantly we should switch to an incremental index or chunked
-            # processing.
-            if not canonical_nodes:
-                canonical_nodes[node.uuid] = node
-                continue
-
-            existing_candidates = list(canonical_nodes.values())
-            normalized = _normalize_string_exact(node.name)
-            exact_match = next(
-                (
-                    candidate
-                    for candidate in existing_candidates
-                    if _normalize_string_exact(candidate.name) == normalized
-                ),
-                None,
-            )
-            if exact_match is not None:
-                if exact_match.uuid != node.uuid:
-                    duplicate_pairs.append((node.uuid, exact_match.uuid))
-                continue
-
-            indexes = _build_candidate_indexes(existing_candidates)
-            state = DedupResolutionState(
-                resolved_nodes=[None],
-                uuid_map={},
-                unresolved_indices=[],
-            )
-            _resolve_with_similarity([node], indexes, state)
-
-            resolved = state.resolved_nodes[0]
-            if resolved is None:
-                canonical_nodes[node.uuid] = node
-                continue
-
-            canonical_uuid = resolved.uuid
-            canonical_nodes.setdefault(canonical_uuid, resolved)
-            if canonical_uuid != node.uuid:
-                duplicate_pairs.append((node.uuid, canonical_uuid))
+    canonical_indexes = DedupCandidateIndexes()
+    for node, band_keys in zip(batch_nodes, batch_band_keys, strict=True):
+        match = canonical_indexes.query(node, band_keys)
+        if match is None:
+            if node.uuid not in canonical_nodes:
+                canonical_indexes.add(node, band_keys)
+            canonical_nodes[node.uuid] = node
+            continue
+
+        if match.uuid != node.uuid:
+            duplicate_pairs.append((node.uuid, match.uuid))
 
     union_pairs: list[tuple[str, str]] = []
     for uuid_map in per_episode_uuid_maps:
@@ -399,6 +415,54 @@ async def dedupe_nodes_bulk(
     return nodes_by_episode, compressed_map
 
 
+def _find_edge_dedupe_candidates(
+    edges: list[EntityEdge], min_score: float
+) -> dict[str, list[EntityEdge]]:
+    """Map each edge uuid to the other batch edges that may duplicate it.
+
+    Only edges sharing the same (source, target) pair are compared. Within a group, an edge is a
+    candidate when its fact shares a word with the other fact (a cheap stand-in for BM25 that
+    casts a wider net) or when the cosine similarity of the fact embeddings reaches
+    ``min_score``. Each fact is tokenized once and each group is scored with a single
+    token-incidence product and a single normalized embedding product.
+    """
+    groups: dict[tuple[str, str], list[EntityEdge]] = {}
+    for edge in edges:
+        groups.setdefault((edge.source_node_uuid, edge.target_node_uuid), []).append(edge)
+
+    candidates_by_uuid: dict[str, list[EntityEdge]] = {edge.uuid: [] for edge in edges}
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+
+        vocabulary: dict[str, int] = {}
+        token_ids = [
+            [
+                vocabulary.setdefault(word, len(vocabulary))
+                for word in set(edge.fact.lower().split())
+            ]
+            for edge in group
+        ]
+        incidence = np.zeros((len(group), len(vocabulary)), dtype=np.float32)
+        for row, ids in enumerate(token_ids):
+            incidence[row, ids] = 1.0
+        word_overlap = (incidence @ incidence.T) > 0
+
+        dim = max((len(edge.fact_embedding or []) for edge in group), default=0)
+        embeddings = np.zeros((len(group), dim), dtype=np.float64)
+        for row, edge in enumerate(group):
+            if edge.fact_embedding:
+                embeddings[row] = normalize_l2(edge.fact_embedding)
+        similar = (embeddings @ embeddings.T) >= min_score
+
+        uuids = np.array([edge.uuid for edge in group], dtype=object)
+        matches = (word_overlap | similar) & (uuids[:, None] != uuids[None, :])
+        for row, edge in enumerate(group):
+            candidates_by_uuid[edge.uuid] = [group[col] for col in np.flatnonzero(matches[row])]
+
+    return candidates_by_uuid
+
+
 async def dedupe_edges_bulk(
     clients: GraphitiClients,
     extracted_edges: list[list[EntityEdge]],
@@ -416,42 +480,14 @@ async def dedupe_edges_bulk(
     )
 
     # Find similar results
-    dedupe_tuples: list[tuple[EpisodicNode, EntityEdge, list[EntityEdge]]] = []
-    for i, edges_i in enumerate(extracted_edges):
-        existing_edges: list[EntityEdge] = []
-        for edges_j in extracted_edges:
-            existing_edges += edges_j
-
-        for edge in edges_i:
-            candidates: list[EntityEdge] = []
-            for existing_edge in existing_edges:
-                # Skip self-comparison
-                if edge.uuid == existing_edge.uuid:
-                    continue
-                # Approximate BM25 by checking for word overlaps (this is faster than creating many in-memory indices)
-                # This approach will cast a wider net than BM25, which is ideal for this use case
-                if (
-                    edge.source_node_uuid != existing_edge.source_node_uuid
-                    or edge.target_node_uuid != existing_edge.target_node_uuid
-                ):
-                    continue
-
-                edge_words = set(edge.fact.lower().split())
-                existing_edge_words = set(existing_edge.fact.lower().split())
-                has_overlap = not edge_words.isdisjoint(existing_edge_words)
-                if has_overlap:
-                    candidates.append(existing_edge)
-                    continue
-
-                # Check for semantic similarity even if there is no overlap
-                similarity = np.dot(
-                    normalize_l2(edge.fact_embedding or []),
-                    normalize_l2(existing_edge.fact_embedding or []),
-                )
-                if similarity >= min_score:
-                    candidates.append(existing_edge)
-
-            dedupe_tuples.append((episode_tuples[i][0], edge, candidates))
+    candidates_by_uuid = _find_edge_dedupe_candidates(
+        [edge for edges in extracted_edges for edge in edges], min_score
+    )
+    dedupe_tuples: list[tuple[EpisodicNode, EntityEdge, list[EntityEdge]]] = [
+        (episode_tuples[i][0], edge, candidates_by_uuid[edge.uuid])
+        for i, edges_i in enumerate(extracted_edges)
+        for edge in edges_i
+    ]
 
     bulk_edge_resolutions: list[
         tuple[EntityEdge, EntityEdge, list[EntityEdge]]
@@ -1,9 +1,13 @@
 import asyncio
 import logging
 from collections import defaultdict
+from dataclasses import dataclass
 
+import numpy as np
+from numpy.typing import NDArray
 from pydantic import BaseModel
 
+from graphiti_core.driver.ann_index import COMMUNITY_NAME_COLLECTION
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.edges import CommunityEdge
 from graphiti_core.embedder import EmbedderClient
@@ -17,6 +21,7 @@ from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.edge_operations import build_community_edges
 
 MAX_COMMUNITY_BUILD_CONCURRENCY = 10
+PROJECTION_PAGE_SIZE = 5000
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +31,124 @@ class Neighbor(BaseModel):
     edge_count: int
 
 
+@dataclass
+class CommunityProjection:
+    """
+    Weighted entity adjacency of one group in CSR form.
+
+    The neighbours of node ``i`` are ``neighbors[offsets[i]:offsets[i + 1]]`` (indices into
+    ``uuids``), with the number of RELATES_TO edges to each in the matching ``weights`` slice.
+    """
+
+    uuids: list[str]
+    offsets: NDArray[np.int64]
+    neighbors: NDArray[np.int64]
+    weights: NDArray[np.int64]
+
+    @classmethod
+    def from_edges(
+        cls,
+        uuids: list[str],
+        sources: NDArray[np.int64],
+        targets: NDArray[np.int64],
+        weights: NDArray[np.int64],
+    ) -> 'CommunityProjection':
+        order = np.argsort(sources, kind='stable')
+        counts = np.bincount(sources, minlength=len(uuids))
+        offsets = np.zeros(len(uuids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(uuids, offsets, targets[order], weights[order])
+
+    @classmethod
+    def from_neighbors(cls, projection: dict[str, list[Neighbor]]) -> 'CommunityProjection':
+        uuids = list(projection)
+        index = {uuid: i for i, uuid in enumerate(uuids)}
+        sources = [index[uuid] for uuid, neighbors in projection.items() for _ in neighbors]
+        targets = [index[n.node_uuid] for neighbors in projection.values() for n in neighbors]
+        weights = [n.edge_count for neighbors in projection.values() for n in neighbors]
+        return cls.from_edges(
+            uuids,
+            np.asarray(sources, dtype=np.int64),
+            np.asarray(targets, dtype=np.int64),
+            np.asarray(weights, dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.uuids)
+
+
+async def get_community_projection(
+    driver: GraphDriver, group_id: str, page_size: int = PROJECTION_PAGE_SIZE
+) -> CommunityProjection:
+    """
+    Load the weighted adjacency of a group with one aggregate query per page of entities.
+
+    Pages are keyed on uuid, so each round-trip holds at most ``page_size`` entities and their
+    neighbour counts regardless of group size.
+    """
+    match_query = """
+        OPTIONAL MATCH (n)-[e:RELATES_TO]-(m:Entity {group_id: $group_id})
+    """
+    if driver.provider == GraphProvider.KUZU:
+        match_query = """
+        OPTIONAL MATCH (n)-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(m:Entity {group_id: $group_id})
+        """
+
+    query = (
+        """
+        MATCH (n:Entity {group_id: $group_id})
+        WHERE n.uuid > $cursor
+        WITH n
+        ORDER BY n.uuid
+        LIMIT $page_size
+        """
+        + match_query
+        + """
+        WITH n.uuid AS uuid, m.uuid AS neighbor_uuid, count(e) AS count
+        RETURN uuid, neighbor_uuid, count
+        """
+    )
+
+    uuids: list[str] = []
+    index: dict[str, int] = {}
+    sources: list[int] = []
+    neighbor_uuids: list[str] = []
+    weights: list[int] = []
+
+    cursor = ''
+    while True:
+        records, _, _ = await driver.execute_query(
+            query, group_id=group_id, cursor=cursor, page_size=page_size, routing_='r'
+        )
+
+        page_count = 0
+        for record in records:
+            uuid = record['uuid']
+            if uuid not in index:
+                index[uuid] = len(uuids)
+                uuids.append(uuid)
+                page_count += 1
+                cursor = max(cursor, uuid)
+            if record['neighbor_uuid'] is not None:
+                sources.append(index[uuid])
+                neighbor_uuids.append(record['neighbor_uuid'])
+                weights.append(record['count'])
+
+        if page_count < page_size:
+            break
+
+    # Neighbours are only known to be entities of this group once every page has been read
+    targets = [index.get(neighbor_uuid, -1) for neighbor_uuid in neighbor_uuids]
+    source_array = np.asarray(sources, dtype=np.int64)
+    target_array = np.asarray(targets, dtype=np.int64)
+    weight_array = np.asarray(weights, dtype=np.int64)
+    known = target_array >= 0
+
+    return CommunityProjection.from_edges(
+        uuids, source_array[known], target_array[known], weight_array[known]
+    )
+
+
 async def get_community_clusters(
     driver: GraphDriver, group_ids: list[str] | None
 ) -> list[list[EntityNode]]:
@@ -44,31 +167,7 @@ async def get_community_clusters(
         group_ids = group_id_values[0]['group_ids'] if group_id_values else []
 
     for group_id in group_ids:
-        projection: dict[str, list[Neighbor]] = {}
-        nodes = await EntityNode.get_by_group_ids(driver, [group_id])
-        for node in nodes:
-            match_query = """
-                MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[e:RELATES_TO]-(m: Entity {group_id: $group_id})
-            """
-            if driver.provider == GraphProvider.KUZU:
-                match_query = """
-                MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(m: Entity {group_id: $group_id})
-                """
-            records, _, _ = await driver.execute_query(
-                match_query
-                + """
-                WITH count(e) AS count, m.uuid AS uuid
-                RETURN
-                    uuid,
-                    count
-                """,
-                uuid=node.uuid,
-                group_id=group_id,
-            )
-
-            projection[node.uuid] = [
-                Neighbor(node_uuid=record['uuid'], edge_count=record['count']) for record in records
-            ]
+        projection = await get_community_projection(driver, group_id)
 
         cluster_uuids = label_propagation(projection)
 
@@ -83,25 +182,26 @@ async def get_community_clusters(
     return community_clusters
 
 
-def label_propagation(projection: dict[str, list[Neighbor]]) -> list[list[str]]:
+def label_propagation(projection: CommunityProjection) -> list[list[str]]:
     # Implement the label propagation community detection algorithm.
     # 1. Start with each node being assigned its own community
     # 2. Each node will take on the community of the plurality of its neighbors
     # 3. Ties are broken by going to the largest community
     # 4. Continue until no communities change during propagation
 
-    community_map = {uuid: i for i, uuid in enumerate(projection.keys())}
+    community_map = list(range(len(projection)))
+    offsets = projection.offsets.tolist()
+    neighbors = projection.neighbors.tolist()
+    weights = projection.weights.tolist()
 
     while True:
         no_change = True
-        new_community_map: dict[str, int] = {}
-
-        for uuid, neighbors in projection.items():
-            curr_community = community_map[uuid]
+        new_community_map: list[int] = []
 
+        for i, curr_community in enumerate(community_map):
             community_candidates: dict[int, int] = defaultdict(int)
-            for neighbor in neighbors:
-                community_candidates[community_map[neighbor.node_uuid]] += neighbor.edge_count
+            for j in range(offsets[i], offsets[i + 1]):
+                community_candidates[community_map[neighbors[j]]] += weights[j]
             community_lst = [
                 (count, community) for community, count in community_candidates.items()
             ]
@@ -113,7 +213,7 @@ def label_propagation(projection: dict[str, list[Neighbor]]) -> list[list[str]]:
             else:
                 new_community = max(community_candidate, curr_community)
 
-            new_community_map[uuid] = new_community
+            new_community_map.append(new_community)
 
             if new_community != curr_community:
                 no_change = False
@@ -124,7 +224,7 @@ def label_propagation(projection: dict[str, list[Neighbor]]) -> list[list[str]]:
         community_map = new_community_map
 
     community_cluster_map = defaultdict(list)
-    for uuid, community in community_map.items():
+    for uuid, community in zip(projection.uuids, community_map, strict=True):
         community_cluster_map[community].append(uuid)
 
     clusters = [cluster for cluster in community_cluster_map.values()]
@@ -242,6 +342,9 @@ async def remove_communities(driver: GraphDriver):
         """
     )
 
+    if driver.ann_index is not None:
+        driver.ann_index.clear(COMMUNITY_NAME_COLLECTION)
+
 
 async def determine_entity_community(
     driver: GraphDriver, entity: EntityNode
@@ -19,12 +19,14 @@ from __future__ import annotations
 import math
 import re
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable, Sequence
 from dataclasses import dataclass, field
 from functools import lru_cache
 from hashlib import blake2b
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from graphiti_core.nodes import EntityNode
 
@@ -34,6 +36,18 @@ _MIN_TOKEN_COUNT = 2
 _FUZZY_JACCARD_THRESHOLD = 0.9
 _MINHASH_PERMUTATIONS = 32
 _MINHASH_BAND_SIZE = 4
+# Universal hashing (a * x + b) mod p over the Mersenne prime 2**31 - 1 keeps every product below
+# 2**62, so all permutations can be evaluated exactly in uint64 arithmetic.
+_MINHASH_PRIME = np.uint64((1 << 31) - 1)
+_MINHASH_SEED = 1
+_MINHASH_A = np.random.default_rng(_MINHASH_SEED).integers(
+    1, int(_MINHASH_PRIME), size=_MINHASH_PERMUTATIONS, dtype=np.uint64
+)
+_MINHASH_B = np.random.default_rng(_MINHASH_SEED + 1).integers(
+    0, int(_MINHASH_PRIME), size=_MINHASH_PERMUTATIONS, dtype=np.uint64
+)
+# Odd 64-bit multiplier used to fold each band of signature values into a single bucket key.
+_BAND_KEY_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
 
 
 def _normalize_string_exact(name: str) -> str:
@@ -100,18 +114,62 @@ def _hash_shingle(shingle: str, seed: int) -> int:
     return int.from_bytes(digest.digest(), 'big')
 
 
+@lru_cache(maxsize=8192)
+def _shingle_base_hash(shingle: str) -> int:
+    """Hash a shingle once into the universal-hash domain shared by every permutation."""
+    return _hash_shingle(shingle, 0) % int(_MINHASH_PRIME)
+
+
+def _minhash_signatures(shingle_sets: Sequence[Collection[str]]) -> np.ndarray:
+    """Compute MinHash signatures for a batch of shingle sets as one (n, permutations) matrix.
+
+    Every shingle is hashed once to a base value; all permutations are then produced together
+    with the vectorized universal hash and reduced per set with ``np.minimum.reduceat``. Rows for
+    empty shingle sets are left at the uint64 maximum and should not be bucketed.
+    """
+    signatures = np.full(
+        (len(shingle_sets), _MINHASH_PERMUTATIONS), np.iinfo(np.uint64).max, dtype=np.uint64
+    )
+    non_empty = [idx for idx, shingles in enumerate(shingle_sets) if shingles]
+    if not non_empty:
+        return signatures
+
+    lengths = [len(shingle_sets[idx]) for idx in non_empty]
+    base_hashes = np.fromiter(
+        (_shingle_base_hash(s) for idx in non_empty for s in shingle_sets[idx]),
+        dtype=np.uint64,
+        count=sum(lengths),
+    )
+    permuted = (base_hashes[:, None] * _MINHASH_A + _MINHASH_B) % _MINHASH_PRIME
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    signatures[non_empty] = np.minimum.reduceat(permuted, offsets, axis=0)
+    return signatures
+
+
 def _minhash_signature(shingles: Iterable[str]) -> tuple[int, ...]:
     """Compute the MinHash signature for the shingle set across predefined permutations."""
-    if not shingles:
+    shingle_list = list(shingles)
+    if not shingle_list:
         return tuple()
 
-    seeds = range(_MINHASH_PERMUTATIONS)
-    signature: list[int] = []
-    for seed in seeds:
-        min_hash = min(_hash_shingle(shingle, seed) for shingle in shingles)
-        signature.append(min_hash)
+    return tuple(int(value) for value in _minhash_signatures([shingle_list])[0])
 
-    return tuple(signature)
+
+def _lsh_band_keys(signatures: np.ndarray) -> np.ndarray:
+    """Fold each complete band of a signature matrix into one uint64 bucket key per band.
+
+    Returns an (n, bands) matrix. Distinct bands can collide on a key, which only adds a
+    candidate that the Jaccard check later rejects.
+    """
+    band_count = signatures.shape[1] // _MINHASH_BAND_SIZE
+    bands = signatures[:, : band_count * _MINHASH_BAND_SIZE].reshape(
+        signatures.shape[0], band_count, _MINHASH_BAND_SIZE
+    )
+    keys = np.zeros(bands.shape[:2], dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for offset in range(_MINHASH_BAND_SIZE):
+            keys = keys * _BAND_KEY_MULTIPLIER + bands[:, :, offset]
+    return keys
 
 
 def _lsh_bands(signature: Iterable[int]) -> list[tuple[int, ...]]:
@@ -146,15 +204,100 @@ def _cached_shingles(name: str) -> set[str]:
     return _shingles(name)
 
 
+def _name_band_keys(normalized_fuzzy_names: Sequence[str]) -> np.ndarray:
+    """Compute LSH band keys for a batch of fuzzy-normalized names in one pass."""
+    return _lsh_band_keys(
+        _minhash_signatures([_cached_shingles(n) for n in normalized_fuzzy_names])
+    )
+
+
 @dataclass
 class DedupCandidateIndexes:
-    """Precomputed lookup structures that drive entity deduplication heuristics."""
+    """Lookup structures that drive entity deduplication heuristics.
 
-    existing_nodes: list[EntityNode]
-    nodes_by_uuid: dict[str, EntityNode]
-    normalized_existing: defaultdict[str, list[EntityNode]]
-    shingles_by_candidate: dict[str, set[str]]
-    lsh_buckets: defaultdict[tuple[int, tuple[int, ...]], list[str]]
+    The indexes can be built once from a candidate list or grown incrementally with :meth:`add`,
+    so callers that accumulate a canonical pool do not need to rebuild them per node.
+    """
+
+    existing_nodes: list[EntityNode] = field(default_factory=list)
+    nodes_by_uuid: dict[str, EntityNode] = field(default_factory=dict)
+    normalized_existing: defaultdict[str, list[EntityNode]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    shingles_by_candidate: dict[str, set[str]] = field(default_factory=dict)
+    lsh_buckets: defaultdict[tuple[int, int], list[str]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+
+    def add(self, node: EntityNode, band_keys: Sequence[int] | None = None) -> None:
+        """Index a candidate node for exact and fuzzy lookups."""
+        self.add_many([node], None if band_keys is None else [band_keys])
+
+    def add_many(
+        self,
+        nodes: Sequence[EntityNode],
+        band_keys: Sequence[Sequence[int]] | np.ndarray | None = None,
+    ) -> None:
+        """Index a batch of candidates, computing their MinHash bands as a single matrix.
+
+        ``band_keys`` may carry rows precomputed with :func:`_name_band_keys` for the same nodes.
+        """
+        shingle_sets = [_cached_shingles(_normalize_name_for_fuzzy(node.name)) for node in nodes]
+        if band_keys is None:
+            band_keys = _lsh_band_keys(_minhash_signatures(shingle_sets))
+
+        for node, shingles, keys in zip(nodes, shingle_sets, band_keys, strict=True):
+            self.existing_nodes.append(node)
+            self.normalized_existing[_normalize_string_exact(node.name)].append(node)
+            self.nodes_by_uuid[node.uuid] = node
+            self.shingles_by_candidate[node.uuid] = shingles
+            if not shingles:
+                continue
+            for band_index, key in enumerate(keys):
+                self.lsh_buckets[(band_index, int(key))].append(node.uuid)
+
+    def fuzzy_match(
+        self, normalized_fuzzy: str, band_keys: Sequence[int] | None = None
+    ) -> EntityNode | None:
+        """Return the best MinHash/Jaccard candidate above the fuzzy threshold, if any."""
+        shingles = _cached_shingles(normalized_fuzzy)
+        if not shingles:
+            return None
+        keys = _name_band_keys([normalized_fuzzy])[0] if band_keys is None else band_keys
+
+        candidate_ids: set[str] = set()
+        for band_index, key in enumerate(keys):
+            candidate_ids.update(self.lsh_buckets.get((band_index, int(key)), []))
+
+        best_candidate: EntityNode | None = None
+        best_score = 0.0
+        for candidate_id in candidate_ids:
+            candidate_shingles = self.shingles_by_candidate.get(candidate_id, set())
+            score = _jaccard_similarity(shingles, candidate_shingles)
+            if score > best_score:
+                best_score = score
+                best_candidate = self.nodes_by_uuid.get(candidate_id)
+
+        if best_candidate is not None and best_score >= _FUZZY_JACCARD_THRESHOLD:
+            return best_candidate
+
+        return None
+
+    def query(self, node: EntityNode, band_keys: Sequence[int] | None = None) -> EntityNode | None:
+        """Return the indexed node that ``node`` resolves to, or None without a confident match.
+
+        The first exact normalized-name hit wins. Otherwise high-entropy names fall back to the
+        fuzzy MinHash match.
+        """
+        exact_matches = self.normalized_existing.get(_normalize_string_exact(node.name))
+        if exact_matches:
+            return exact_matches[0]
+
+        normalized_fuzzy = _normalize_name_for_fuzzy(node.name)
+        if not _has_high_entropy(normalized_fuzzy):
+            return None
+
+        return self.fuzzy_match(normalized_fuzzy, band_keys)
 
 
 @dataclass
@@ -169,30 +312,9 @@ class DedupResolutionState:
 
 def _build_candidate_indexes(existing_nodes: list[EntityNode]) -> DedupCandidateIndexes:
     """Precompute exact and fuzzy lookup structures once per dedupe run."""
-    normalized_existing: defaultdict[str, list[EntityNode]] = defaultdict(list)
-    nodes_by_uuid: dict[str, EntityNode] = {}
-    shingles_by_candidate: dict[str, set[str]] = {}
-    lsh_buckets: defaultdict[tuple[int, tuple[int, ...]], list[str]] = defaultdict(list)
-
-    for candidate in existing_nodes:
-        normalized = _normalize_string_exact(candidate.name)
-        normalized_existing[normalized].append(candidate)
-        nodes_by_uuid[candidate.uuid] = candidate
-
-        shingles = _cached_shingles(_normalize_name_for_fuzzy(candidate.name))
-        shingles_by_candidate[candidate.uuid] = shingles
-
-        signature = _minhash_signature(shingles)
-        for band_index, band in enumerate(_lsh_bands(signature)):
-            lsh_buckets[(band_index, band)].append(candidate.uuid)
-
-    return DedupCandidateIndexes(
-        existing_nodes=existing_nodes,
-        nodes_by_uuid=nodes_by_uuid,
-        normalized_existing=normalized_existing,
-        shingles_by_candidate=shingles_by_candidate,
-        lsh_buckets=lsh_buckets,
-    )
+    indexes = DedupCandidateIndexes()
+    indexes.add_many(existing_nodes)
+    return indexes
 
 
 def _resolve_with_similarity(
@@ -201,9 +323,11 @@ def _resolve_with_similarity(
     state: DedupResolutionState,
 ) -> None:
     """Attempt deterministic resolution using exact name hits and fuzzy MinHash comparisons."""
+    normalized_fuzzy_names = [_normalize_name_for_fuzzy(node.name) for node in extracted_nodes]
+    band_keys = _name_band_keys(normalized_fuzzy_names)
     for idx, node in enumerate(extracted_nodes):
         normalized_exact = _normalize_string_exact(node.name)
-        normalized_fuzzy = _normalize_name_for_fuzzy(node.name)
+        normalized_fuzzy = normalized_fuzzy_names[idx]
 
         if not _has_high_entropy(normalized_fuzzy):
             state.unresolved_indices.append(idx)
@@ -221,22 +345,8 @@ def _resolve_with_similarity(
             state.unresolved_indices.append(idx)
             continue
 
-        shingles = _cached_shingles(normalized_fuzzy)
-        signature = _minhash_signature(shingles)
-        candidate_ids: set[str] = set()
-        for band_index, band in enumerate(_lsh_bands(signature)):
-            candidate_ids.update(indexes.lsh_buckets.get((band_index, band), []))
-
-        best_candidate: EntityNode | None = None
-        best_score = 0.0
-        for candidate_id in candidate_ids:
-            candidate_shingles = indexes.shingles_by_candidate.get(candidate_id, set())
-            score = _jaccard_similarity(shingles, candidate_shingles)
-            if score > best_score:
-                best_score = score
-                best_candidate = indexes.nodes_by_uuid.get(candidate_id)
-
-        if best_candidate is not None and best_score >= _FUZZY_JACCARD_THRESHOLD:
+        best_candidate = indexes.fuzzy_match(normalized_fuzzy, band_keys[idx])
+        if best_candidate is not None:
             state.resolved_nodes[idx] = best_candidate
             state.uuid_map[node.uuid] = best_candidate.uuid
             if best_candidate.uuid != node.uuid:
@@ -253,7 +363,10 @@ __all__ = [
     '_normalize_name_for_fuzzy',
     '_has_high_entropy',
     '_minhash_signature',
+    '_minhash_signatures',
     '_lsh_bands',
+    '_lsh_band_keys',
+    '_name_band_keys',
     '_jaccard_similarity',
     '_cached_shingles',
     '_FUZZY_JACCARD_THRESHOLD',
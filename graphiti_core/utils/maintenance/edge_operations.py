@@ -274,22 +274,9 @@ async def resolve_extracted_edges(
         ]
     )
 
-    related_edges_results: list[SearchResults] = await semaphore_gather(
-        *[
-            search(
-                clients,
-                extracted_edge.fact,
-                group_ids=[extracted_edge.group_id],
-                config=EDGE_HYBRID_SEARCH_RRF,
-                search_filter=SearchFilters(edge_uuids=[edge.uuid for edge in valid_edges]),
-            )
-            for extracted_edge, valid_edges in zip(extracted_edges, valid_edges_list, strict=True)
-        ]
-    )
-
-    related_edges_lists: list[list[EntityEdge]] = [result.edges for result in related_edges_results]
-
-    edge_invalidation_candidate_results: list[SearchResults] = await semaphore_gather(
+    # A single search per fact feeds both candidate lists. The precomputed fact embedding is
+    # passed through as the query vector so the embedder is not called again per search.
+    search_results: list[SearchResults] = await semaphore_gather(
         *[
             search(
                 clients,
@@ -297,13 +284,19 @@ async def resolve_extracted_edges(
                 group_ids=[extracted_edge.group_id],
                 config=EDGE_HYBRID_SEARCH_RRF,
                 search_filter=SearchFilters(),
+                query_vector=extracted_edge.fact_embedding,
             )
             for extracted_edge in extracted_edges
         ]
     )
 
+    related_edges_lists: list[list[EntityEdge]] = [
+        _select_related_edges(result.edges, valid_edges, EDGE_HYBRID_SEARCH_RRF.limit)
+        for result, valid_edges in zip(search_results, valid_edges_list, strict=True)
+    ]
+
     edge_invalidation_candidates: list[list[EntityEdge]] = [
-        result.edges for result in edge_invalidation_candidate_results
+        result.edges for result in search_results
     ]
 
     logger.debug(
@@ -403,6 +396,26 @@ async def resolve_extracted_edges(
     return resolved_edges, invalidated_edges
 
 
+def _select_related_edges(
+    searched_edges: list[EntityEdge], valid_edges: list[EntityEdge], limit: int
+) -> list[EntityEdge]:
+    """Pick the duplicate candidates for an extracted edge from its combined search results.
+
+    Edges between the same endpoints that the search ranked come first, in rank order, followed
+    by any remaining edges between those endpoints that did not make the ranked list.
+    """
+    valid_edge_map = {edge.uuid: edge for edge in valid_edges}
+
+    related_edges: list[EntityEdge] = []
+    for edge in searched_edges:
+        if valid_edge_map.pop(edge.uuid, None) is not None:
+            related_edges.append(edge)
+
+    related_edges.extend(valid_edge_map.values())
+
+    return related_edges[:limit]
+
+
 def resolve_edge_contradictions(
     resolved_edge: EntityEdge, invalidation_candidates: list[EntityEdge]
 ) -> list[EntityEdge]:
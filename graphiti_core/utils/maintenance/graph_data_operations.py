@@ -57,6 +57,13 @@ async def clear_data(driver: GraphDriver, group_ids: list[str] | None = None):
         else:
             await session.execute_write(delete_group_ids)
 
+    if driver.ann_index is not None:
+        if group_ids is None:
+            driver.ann_index.clear()
+        else:
+            for group_id in group_ids:
+                driver.ann_index.remove_group(group_id)
+
 
 async def retrieve_episodes(
     driver: GraphDriver,
@@ -39,7 +39,7 @@ from graphiti_core.prompts.extract_nodes import (
     ExtractedEntity,
     MissedEntities,
 )
-from graphiti_core.search.search import search
+from graphiti_core.search.search import search_many
 from graphiti_core.search.search_config import SearchResults
 from graphiti_core.search.search_config_recipes import NODE_HYBRID_SEARCH_RRF
 from graphiti_core.search.search_filters import SearchFilters
@@ -214,20 +214,29 @@ async def _collect_candidate_nodes(
     existing_nodes_override: list[EntityNode] | None,
 ) -> list[EntityNode]:
     """Search per extracted name and return unique candidates with overrides honored in order."""
-    search_results: list[SearchResults] = await semaphore_gather(
+    nodes_by_group_id: dict[str, list[EntityNode]] = {}
+    for node in extracted_nodes:
+        nodes_by_group_id.setdefault(node.group_id, []).append(node)
+
+    search_results_by_group: list[list[SearchResults]] = await semaphore_gather(
         *[
-            search(
+            search_many(
                 clients=clients,
-                query=node.name,
-                group_ids=[node.group_id],
+                queries=[node.name for node in group_nodes],
+                group_ids=[group_id],
                 search_filter=SearchFilters(),
                 config=NODE_HYBRID_SEARCH_RRF,
             )
-            for node in extracted_nodes
+            for group_id, group_nodes in nodes_by_group_id.items()
         ]
     )
 
-    candidate_nodes: list[EntityNode] = [node for result in search_results for node in result.nodes]
+    candidate_nodes: list[EntityNode] = [
+        node
+        for search_results in search_results_by_group
+        for result in search_results
+        for node in result.nodes
+    ]
 
     if existing_nodes_override is not None:
         candidate_nodes.extend(existing_nodes_override)
@@ -0,0 +1,107 @@
+"""
+Microbenchmark for the canonical-pool pass of dedupe_nodes_bulk.
+
+Compares rebuilding the MinHash/LSH candidate indexes for every node (the previous approach)
+against the incremental DedupCandidateIndexes. Run with:
+
+    python -m tests.benchmarks.bench_dedup_indexes --sizes 100 1000 10000
+"""
+
+import argparse
+import random
+import string
+import time
+
+from graphiti_core.nodes import EntityNode
+from graphiti_core.utils.maintenance.dedup_helpers import (
+    DedupCandidateIndexes,
+    DedupResolutionState,
+    _build_candidate_indexes,
+    _normalize_string_exact,
+    _resolve_with_similarity,
+)
+
+
+def _make_nodes(count: int, seed: int = 7) -> list[EntityNode]:
+    rng = random.Random(seed)
+    nodes: list[EntityNode] = []
+    for _ in range(count):
+        name = ' '.join(
+            ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 9))) for _ in range(2)
+        )
+        nodes.append(EntityNode(name=name, group_id='bench', labels=['Entity']))
+    # Sprinkle in near-duplicates so both the exact and fuzzy paths are exercised.
+    for node in rng.sample(nodes, k=max(1, count // 10)):
+        nodes.append(EntityNode(name=node.name.upper(), group_id='bench', labels=['Entity']))
+    return nodes
+
+
+def _rebuild_per_node(nodes: list[EntityNode]) -> int:
+    canonical_nodes: dict[str, EntityNode] = {}
+    duplicates = 0
+    for node in nodes:
+        if not canonical_nodes:
+            canonical_nodes[node.uuid] = node
+            continue
+
+        existing_candidates = list(canonical_nodes.values())
+        normalized = _normalize_string_exact(node.name)
+        if any(_normalize_string_exact(c.name) == normalized for c in existing_candidates):
+            duplicates += 1
+            continue
+
+        indexes = _build_candidate_indexes(existing_candidates)
+        state = DedupResolutionState(resolved_nodes=[None], uuid_map={}, unresolved_indices=[])
+        _resolve_with_similarity([node], indexes, state)
+        if state.resolved_nodes[0] is None:
+            canonical_nodes[node.uuid] = node
+        else:
+            duplicates += 1
+    return duplicates
+
+
+def _incremental(nodes: list[EntityNode]) -> int:
+    indexes = DedupCandidateIndexes()
+    duplicates = 0
+    for node in nodes:
+        if indexes.query(node) is None:
+            indexes.add(node)
+        else:
+            duplicates += 1
+    return duplicates
+
+
+def _time(fn, nodes: list[EntityNode]) -> tuple[float, int]:
+    start = time.perf_counter()
+    duplicates = fn(nodes)
+    return time.perf_counter() - start, duplicates
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark canonical node dedupe scaling.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument(
+        '--max-rebuild-size',
+        type=int,
+        default=1000,
+        help='Skip the quadratic rebuild-per-node baseline above this size',
+    )
+    args = parser.parse_args()
+
+    print(f'{"nodes":>8} {"rebuild (s)":>12} {"incremental (s)":>16} {"speedup":>8}')
+    for size in args.sizes:
+        nodes = _make_nodes(size)
+        incremental_s, incremental_dupes = _time(_incremental, nodes)
+        if size > args.max_rebuild_size:
+            print(f'{size:>8} {"skipped":>12} {incremental_s:>16.4f} {"-":>8}')
+            continue
+        rebuild_s, rebuild_dupes = _time(_rebuild_per_node, nodes)
+        assert rebuild_dupes == incremental_dupes
+        print(
+            f'{size:>8} {rebuild_s:>12.4f} {incremental_s:>16.4f} '
+            f'{rebuild_s / incremental_s:>7.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
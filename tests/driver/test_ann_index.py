@@ -0,0 +1,134 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from graphiti_core.driver.ann_index import (
+    EDGE_FACT_COLLECTION,
+    ENTITY_NAME_COLLECTION,
+    ANNIndex,
+)
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.edges import EntityEdge
+from graphiti_core.nodes import EntityNode
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_utils import node_similarity_search
+
+
+def _node(uuid: str, embedding: list[float], group_id: str = 'g1') -> EntityNode:
+    return EntityNode(uuid=uuid, name=uuid, group_id=group_id, name_embedding=embedding)
+
+
+def _edge(uuid: str, source: str, target: str, embedding: list[float]) -> EntityEdge:
+    return EntityEdge(
+        uuid=uuid,
+        group_id='g1',
+        source_node_uuid=source,
+        target_node_uuid=target,
+        name='RELATES',
+        fact=uuid,
+        fact_embedding=embedding,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def test_search_ranks_by_cosine_and_filters_groups():
+    index = ANNIndex()
+    index.index_entity_nodes(
+        [
+            _node('a', [1.0, 0.0]),
+            _node('b', [0.6, 0.8]),
+            _node('c', [1.0, 0.1], group_id='g2'),
+        ]
+    )
+
+    assert [uuid for uuid, _ in index.search(ENTITY_NAME_COLLECTION, [1.0, 0.0], 5)] == [
+        'a',
+        'c',
+        'b',
+    ]
+    results = index.search(ENTITY_NAME_COLLECTION, [1.0, 0.0], 5, group_ids=['g1'], min_score=0.7)
+    assert [uuid for uuid, _ in results] == ['a']
+
+
+def test_removing_node_drops_incident_edges():
+    index = ANNIndex()
+    index.index_entity_nodes([_node('a', [1.0, 0.0]), _node('b', [0.0, 1.0])])
+    index.index_entity_edges([_edge('e1', 'a', 'b', [1.0, 1.0])])
+
+    index.remove_nodes(['a'])
+
+    assert [uuid for uuid, _ in index.search(ENTITY_NAME_COLLECTION, [0.0, 1.0], 5)] == ['b']
+    assert index.search(EDGE_FACT_COLLECTION, [1.0, 1.0], 5) == []
+
+
+def test_ivf_partitions_large_collections_and_reopens_from_disk(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(600, 16)).astype(np.float32)
+    index = ANNIndex(str(tmp_path), train_threshold=256, n_probe=4)
+    index.index_entity_nodes([_node(f'n{i}', vector.tolist()) for i, vector in enumerate(vectors)])
+
+    assert index.collections[ENTITY_NAME_COLLECTION]._centroids is not None
+    assert index.search(ENTITY_NAME_COLLECTION, vectors[42].tolist(), 1)[0][0] == 'n42'
+
+    index.remove_nodes(['n7'])
+    index.flush()
+    reopened = ANNIndex(str(tmp_path), train_threshold=256, n_probe=4)
+
+    assert len(reopened.collections[ENTITY_NAME_COLLECTION]) == 599
+    assert reopened.search(ENTITY_NAME_COLLECTION, vectors[42].tolist(), 1)[0][0] == 'n42'
+    assert all(
+        uuid != 'n7' for uuid, _ in reopened.search(ENTITY_NAME_COLLECTION, vectors[7].tolist(), 5)
+    )
+
+
+@pytest.mark.asyncio
+async def test_node_similarity_search_loads_ann_candidates_in_score_order():
+    driver = MagicMock()
+    driver.provider = GraphProvider.KUZU
+    driver.search_interface = None
+    driver.ann_index = ANNIndex()
+    driver.ann_index.index_entity_nodes([_node('a', [1.0, 0.0]), _node('b', [0.8, 0.6])])
+    driver.execute_query = AsyncMock(
+        return_value=(
+            [
+                {
+                    'uuid': uuid,
+                    'name': uuid,
+                    'group_id': 'g1',
+                    'labels': ['Entity'],
+                    'created_at': datetime.now(timezone.utc),
+                    'summary': '',
+                    'attributes': '{}',
+                }
+                for uuid in ['b', 'a']
+            ],
+            None,
+            None,
+        )
+    )
+
+    nodes = await node_similarity_search(driver, [1.0, 0.0], SearchFilters(), ['g1'], limit=1)
+
+    query = driver.execute_query.await_args.args[0]
+    assert 'n.uuid IN $candidate_uuids' in query
+    assert 'array_cosine_similarity' not in query
+    assert driver.execute_query.await_args.kwargs['candidate_uuids'] == ['a', 'b']
+    assert [node.uuid for node in nodes] == ['a']
@@ -0,0 +1,91 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections.abc import Iterable
+
+import pytest
+
+from graphiti_core.embedder.cache import CachedEmbedder
+from graphiti_core.embedder.client import EmbedderClient, EmbedderConfig
+
+
+class CountingEmbedder(EmbedderClient):
+    def __init__(self):
+        self.config = EmbedderConfig(embedding_dim=3)
+        self.create_calls: list[str] = []
+        self.batch_calls: list[list[str]] = []
+
+    @staticmethod
+    def _embed(text: str) -> list[float]:
+        return [float(len(text)), 0.5, 0.25]
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        assert isinstance(input_data, str)
+        self.create_calls.append(input_data)
+        return self._embed(input_data)
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        self.batch_calls.append(list(input_data_list))
+        return [self._embed(text) for text in input_data_list]
+
+
+@pytest.mark.asyncio
+async def test_create_caches_normalized_text():
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(inner)
+
+    first = await embedder.create('Alice  Smith')
+    second = await embedder.create(' Alice Smith ')
+
+    assert first == second
+    assert inner.create_calls == ['Alice  Smith']
+    assert (embedder.stats.hits, embedder.stats.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_create_batch_only_sends_misses():
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(inner)
+    await embedder.create('alice')
+
+    results = await embedder.create_batch(['alice', 'bob', 'carol', 'bob'])
+
+    assert inner.batch_calls == [['bob', 'carol']]
+    assert results == [CountingEmbedder._embed(t) for t in ['alice', 'bob', 'carol', 'bob']]
+    assert embedder.stats.hits == 1
+
+    await embedder.create_batch(['carol', 'bob'])
+    assert len(inner.batch_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_bound_and_disk_tier(tmp_path):
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(inner, max_size=1, cache_dir=str(tmp_path))
+
+    await embedder.create_batch(['alice', 'bob'])
+    assert len(embedder._memory) == 1
+
+    # 'alice' was evicted from memory but is served from the float32 disk tier.
+    assert await embedder.create('alice') == CountingEmbedder._embed('alice')
+    assert inner.create_calls == []
+    assert embedder.stats.disk_hits == 1
+
+    reopened = CachedEmbedder(CountingEmbedder(), cache_dir=str(tmp_path))
+    assert await reopened.create_batch(['bob']) == [CountingEmbedder._embed('bob')]
+    assert reopened.stats.misses == 0
@@ -0,0 +1,108 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+
+import pytest
+
+from graphiti_core.llm_client.cache import (
+    DiskCacheBackend,
+    LLMResponseCache,
+    MemoryCacheBackend,
+    TieredCacheBackend,
+)
+from graphiti_core.llm_client.client import LLMClient
+from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.prompts.models import Message
+
+
+class CountingLLMClient(LLMClient):
+    def __init__(self, **kwargs):
+        super().__init__(LLMConfig(), **kwargs)
+        self.calls = 0
+
+    async def _generate_response(
+        self, messages, response_model=None, max_tokens=0, model_size=None
+    ):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {'content': messages[-1].content}
+
+
+def _messages(content: str) -> list[Message]:
+    return [Message(role='system', content='system'), Message(role='user', content=content)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_prompts_share_one_call():
+    client = CountingLLMClient(cache=True, cache_backend=MemoryCacheBackend())
+
+    responses = await asyncio.gather(
+        *[
+            client.generate_response(_messages('same'), prompt_name='dedupe_nodes.nodes')
+            for _ in range(5)
+        ]
+    )
+
+    assert client.calls == 1
+    assert all(response == responses[0] for response in responses)
+    assert client.response_cache is not None
+    stats = client.response_cache.stats['dedupe_nodes.nodes']
+    assert (stats.misses, stats.coalesced, stats.hits) == (1, 4, 0)
+
+    await client.generate_response(_messages('same'), prompt_name='dedupe_nodes.nodes')
+    assert client.calls == 1
+    assert stats.hits == 1
+    assert stats.hit_rate == pytest.approx(5 / 6)
+
+
+@pytest.mark.asyncio
+async def test_failed_generation_propagates_to_waiters_and_is_not_cached():
+    cache = LLMResponseCache(MemoryCacheBackend())
+    attempts = 0
+
+    async def failing():
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.01)
+        raise ValueError('boom')
+
+    results = await asyncio.gather(
+        cache.get_or_generate('key', failing),
+        cache.get_or_generate('key', failing),
+        return_exceptions=True,
+    )
+
+    assert attempts == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+    async def succeeding():
+        return {'ok': True}
+
+    assert await cache.get_or_generate('key', succeeding) == ({'ok': True}, False)
+
+
+@pytest.mark.asyncio
+async def test_tiered_backend_promotes_disk_hits(tmp_path):
+    disk = DiskCacheBackend(str(tmp_path))
+    await disk.set('key', {'value': 1})
+
+    memory = MemoryCacheBackend()
+    tiered = TieredCacheBackend(memory, disk)
+
+    assert await tiered.get('key') == {'value': 1}
+    assert await memory.get('key') == {'value': 1}
+    assert await tiered.get('missing') is None
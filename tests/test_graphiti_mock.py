@@ -79,7 +79,7 @@ def mock_llm_client():
     mock_llm.temperature = 0.0
     mock_llm.max_tokens = 1000
     mock_llm.cache_enabled = False
-    mock_llm.cache_dir = None
+    mock_llm.response_cache = None
 
     # Mock the public method that's actually called
     mock_llm.generate_response = Mock()
@@ -0,0 +1,97 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import random
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.driver import GraphDriver, GraphProvider
+from graphiti_core.edges import EntityEdge
+from graphiti_core.embedder import EmbedderClient
+from graphiti_core.graphiti import Graphiti
+from graphiti_core.llm_client import LLMClient
+from graphiti_core.search.search_config import SearchResults
+from graphiti_core.search.search_config_recipes import (
+    EDGE_HYBRID_SEARCH_NODE_DISTANCE,
+    EDGE_HYBRID_SEARCH_RRF,
+)
+from graphiti_core.utils.datetime_utils import utc_now
+
+
+def _make_graphiti() -> Graphiti:
+    driver = MagicMock(spec=GraphDriver)
+    driver.provider = GraphProvider.NEO4J
+    return Graphiti(
+        graph_driver=driver,
+        llm_client=MagicMock(spec=LLMClient),
+        embedder=MagicMock(spec=EmbedderClient),
+        cross_encoder=MagicMock(spec=CrossEncoderClient),
+    )
+
+
+def _edge(i: int) -> EntityEdge:
+    return EntityEdge(
+        source_node_uuid='source',
+        target_node_uuid='target',
+        name='REL',
+        fact=f'fact {i}',
+        group_id='group',
+        created_at=utc_now(),
+    )
+
+
+def test_search_recipes_are_immutable():
+    with pytest.raises(ValidationError):
+        EDGE_HYBRID_SEARCH_RRF.limit = 3  # type: ignore[misc]
+
+    limited = EDGE_HYBRID_SEARCH_RRF.with_limit(3)
+    assert limited.limit == 3
+    assert limited.edge_config is EDGE_HYBRID_SEARCH_RRF.edge_config
+    assert EDGE_HYBRID_SEARCH_RRF.limit != 3
+    assert EDGE_HYBRID_SEARCH_RRF.with_limit(EDGE_HYBRID_SEARCH_RRF.limit) is EDGE_HYBRID_SEARCH_RRF
+
+
+@pytest.mark.asyncio
+async def test_concurrent_searches_with_different_limits(monkeypatch):
+    graphiti = _make_graphiti()
+    rng = random.Random(0)
+
+    async def fake_search(clients, query, group_ids, config, search_filter, **kwargs):
+        # Yield mid-search so overlapping calls would observe each other's limit if shared.
+        await asyncio.sleep(rng.random() / 100)
+        return SearchResults(edges=[_edge(i) for i in range(config.limit)])
+
+    monkeypatch.setattr('graphiti_core.graphiti.search', fake_search)
+
+    limits = [rng.randint(1, 25) for _ in range(200)]
+    results = await asyncio.gather(
+        *[
+            graphiti.search(
+                f'query {i}',
+                center_node_uuid=None if i % 2 else 'center',
+                num_results=limit,
+            )
+            for i, limit in enumerate(limits)
+        ]
+    )
+
+    assert [len(edges) for edges in results] == limits
+    assert EDGE_HYBRID_SEARCH_RRF.limit == 10
+    assert EDGE_HYBRID_SEARCH_NODE_DISTANCE.limit == 10
@@ -186,6 +186,39 @@ async def test_dedupe_nodes_bulk_missing_canonical_falls_back(monkeypatch, caplo
     assert any('Canonical node missing' in rec.message for rec in caplog.records)
 
 
+@pytest.mark.asyncio
+async def test_dedupe_nodes_bulk_matches_fuzzy_names_across_episodes(monkeypatch):
+    clients = _make_clients()
+
+    episodes = [_make_episode(str(i)) for i in range(3)]
+    canonical = EntityNode(name='Grace Hopper', group_id='group', labels=['Entity'])
+    fuzzy_alias = EntityNode(name='Grace-Hopper', group_id='group', labels=['Entity'])
+    unrelated = EntityNode(name='Alan Turing', group_id='group', labels=['Entity'])
+
+    async def fake_resolve(
+        clients_arg,
+        nodes_arg,
+        episode_arg,
+        previous_episodes_arg,
+        entity_types_arg,
+        existing_nodes_override=None,
+    ):
+        return nodes_arg, {node.uuid: node.uuid for node in nodes_arg}, []
+
+    monkeypatch.setattr(bulk_utils, 'resolve_extracted_nodes', fake_resolve)
+
+    nodes_by_episode, compressed_map = await bulk_utils.dedupe_nodes_bulk(
+        clients,
+        [[canonical], [unrelated, fuzzy_alias], [canonical]],
+        [(episode, []) for episode in episodes],
+    )
+
+    assert compressed_map[fuzzy_alias.uuid] == canonical.uuid
+    assert compressed_map.get(unrelated.uuid, unrelated.uuid) == unrelated.uuid
+    assert nodes_by_episode[episodes[1].uuid] == [unrelated, canonical]
+    assert nodes_by_episode[episodes[2].uuid] == [canonical]
+
+
 def test_build_directed_uuid_map_empty():
     assert bulk_utils._build_directed_uuid_map([]) == {}
 
@@ -326,3 +359,85 @@ async def test_dedupe_edges_bulk_deduplicates_within_episode(monkeypatch):
     for _, compared_against in comparisons_made:
         # Each edge should have access to all 3 edges as candidates
         assert len(compared_against) >= 2  # At least 2 others (self is filtered out)
+
+
+def test_find_edge_dedupe_candidates_groups_by_endpoints():
+    now = utc_now()
+
+    def make_edge(source: str, target: str, fact: str, embedding: list[float]) -> EntityEdge:
+        return EntityEdge(
+            source_node_uuid=source,
+            target_node_uuid=target,
+            name='REL',
+            fact=fact,
+            fact_embedding=embedding,
+            group_id='group',
+            episodes=[],
+            created_at=now,
+            valid_at=now,
+        )
+
+    overlap = make_edge('a', 'b', 'Alice works at Acme', [1.0, 0.0])
+    word_match = make_edge('a', 'b', 'alice founded a startup', [0.0, 1.0])
+    semantic_match = make_edge('a', 'b', 'Employed by the company', [0.9, 0.1])
+    other_pair = make_edge('a', 'c', 'Alice works at Acme', [1.0, 0.0])
+
+    candidates = bulk_utils._find_edge_dedupe_candidates(
+        [overlap, word_match, semantic_match, other_pair], min_score=0.6
+    )
+
+    assert candidates[overlap.uuid] == [word_match, semantic_match]
+    assert candidates[word_match.uuid] == [overlap]
+    assert candidates[semantic_match.uuid] == [overlap]
+    assert candidates[other_pair.uuid] == []
+
+
+@pytest.mark.asyncio
+async def test_add_nodes_and_edges_bulk_embeds_before_opening_session(monkeypatch):
+    calls: list[str] = []
+
+    embedder = MagicMock()
+
+    async def create_batch(texts):
+        calls.append(f'embed:{len(texts)}')
+        return [[0.1, 0.2] for _ in texts]
+
+    embedder.create_batch = AsyncMock(side_effect=create_batch)
+    embedder.create = AsyncMock()
+
+    session = MagicMock()
+    session.execute_write = AsyncMock()
+    session.close = AsyncMock()
+    driver = MagicMock()
+
+    def open_session():
+        calls.append('session')
+        return session
+
+    driver.session = MagicMock(side_effect=open_session)
+    monkeypatch.setattr(bulk_utils, 'EMBEDDING_BATCH_SIZE', 2)
+
+    nodes = [EntityNode(name=f'node {i}', group_id='group', labels=[]) for i in range(3)]
+    nodes[0].name_embedding = [1.0, 0.0]
+    now = utc_now()
+    edges = [
+        EntityEdge(
+            source_node_uuid=nodes[0].uuid,
+            target_node_uuid=nodes[1].uuid,
+            name='REL',
+            fact=f'fact {i}',
+            group_id='group',
+            created_at=now,
+        )
+        for i in range(3)
+    ]
+
+    await bulk_utils.add_nodes_and_edges_bulk(driver, [], [], nodes, edges, embedder)
+
+    # Two missing node embeddings fit one chunk; three edges split into chunks of two and one.
+    assert sorted(calls[:-1]) == ['embed:1', 'embed:2', 'embed:2']
+    assert calls[-1] == 'session'
+    embedder.create.assert_not_awaited()
+    assert nodes[0].name_embedding == [1.0, 0.0]
+    assert all(node.name_embedding is not None for node in nodes)
+    assert all(edge.fact_embedding == [0.1, 0.2] for edge in edges)
@@ -0,0 +1,51 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.utils.maintenance.community_operations import (
+    CommunityProjection,
+    Neighbor,
+    get_community_projection,
+    label_propagation,
+)
+
+
+def _record(uuid: str, neighbor_uuid: str | None, count: int) -> dict:
+    return {'uuid': uuid, 'neighbor_uuid': neighbor_uuid, 'count': count}
+
+
+@pytest.mark.asyncio
+async def test_get_community_projection_pages_by_uuid():
+    driver = MagicMock()
+    driver.provider = GraphProvider.NEO4J
+    driver.execute_query = AsyncMock(
+        side_effect=[
+            ([_record('a', 'b', 2), _record('a', 'c', 1), _record('b', 'a', 2)], None, None),
+            ([_record('c', 'a', 1), _record('d', None, 0)], None, None),
+        ]
+    )
+
+    projection = await get_community_projection(driver, 'g1', page_size=2)
+
+    assert [call.kwargs['cursor'] for call in driver.execute_query.await_args_list] == ['', 'b']
+    assert projection.uuids == ['a', 'b', 'c', 'd']
+    assert projection.offsets.tolist() == [0, 2, 3, 4, 4]
+    assert projection.neighbors.tolist() == [1, 2, 0, 0]
+    assert projection.weights.tolist() == [2, 1, 2, 1]
+
+
+def test_label_propagation_over_projection():
+    projection = CommunityProjection.from_neighbors(
+        {
+            'a': [Neighbor(node_uuid='b', edge_count=1)],
+            'b': [Neighbor(node_uuid='a', edge_count=1)],
+            'c': [Neighbor(node_uuid='d', edge_count=1)],
+            'd': [Neighbor(node_uuid='c', edge_count=1)],
+            'e': [],
+        }
+    )
+
+    clusters = label_propagation(projection)
+
+    assert sorted(sorted(cluster) for cluster in clusters) == [['a', 'b'], ['c', 'd'], ['e']]
@@ -645,3 +645,126 @@ async def test_resolve_extracted_edges_fast_path_deduplication(monkeypatch):
     assert resolve_call_count == 1
     assert len(resolved_edges) == 1
     assert invalidated_edges == []
+
+
+@pytest.mark.asyncio
+async def test_resolve_extracted_edges_single_search_reuses_fact_embedding(monkeypatch):
+    """Test that each fact is searched once with its precomputed embedding."""
+    from graphiti_core.utils.maintenance import edge_operations as edge_ops
+
+    async def fake_create_embeddings(embedder, edges):
+        for edge in edges:
+            edge.fact_embedding = [0.5, 0.5]
+
+    now = datetime.now(timezone.utc)
+    between_edge = EntityEdge(
+        source_node_uuid='source_uuid',
+        target_node_uuid='target_uuid',
+        name='KNOWS',
+        group_id='group_1',
+        fact='Alice knows Bob from school',
+        episodes=[],
+        created_at=now,
+    )
+    unranked_between_edge = EntityEdge(
+        source_node_uuid='source_uuid',
+        target_node_uuid='target_uuid',
+        name='WORKS_WITH',
+        group_id='group_1',
+        fact='Alice works with Bob',
+        episodes=[],
+        created_at=now,
+    )
+    unrelated_edge = EntityEdge(
+        source_node_uuid='other_source',
+        target_node_uuid='other_target',
+        name='LIVES_IN',
+        group_id='group_1',
+        fact='Carol lives in Paris',
+        episodes=[],
+        created_at=now,
+    )
+
+    monkeypatch.setattr(edge_ops, 'create_entity_edge_embeddings', fake_create_embeddings)
+    monkeypatch.setattr(
+        EntityEdge,
+        'get_between_nodes',
+        AsyncMock(return_value=[between_edge, unranked_between_edge]),
+    )
+
+    async def immediate_gather(*aws, max_coroutines=None):
+        return [await aw for aw in aws]
+
+    monkeypatch.setattr(edge_ops, 'semaphore_gather', immediate_gather)
+    search_mock = AsyncMock(return_value=SearchResults(edges=[unrelated_edge, between_edge]))
+    monkeypatch.setattr(edge_ops, 'search', search_mock)
+
+    captured: dict[str, list[EntityEdge]] = {}
+
+    async def mock_resolve_extracted_edge(
+        llm_client,
+        extracted_edge,
+        related_edges,
+        existing_edges,
+        episode,
+        edge_type_candidates=None,
+        custom_edge_type_names=None,
+    ):
+        captured['related'] = related_edges
+        captured['existing'] = existing_edges
+        return extracted_edge, [], []
+
+    monkeypatch.setattr(edge_ops, 'resolve_extracted_edge', mock_resolve_extracted_edge)
+
+    embedder = MagicMock()
+    embedder.create = AsyncMock()
+    clients = SimpleNamespace(
+        driver=MagicMock(),
+        llm_client=MagicMock(),
+        embedder=embedder,
+        cross_encoder=MagicMock(),
+    )
+
+    extracted_edge = EntityEdge(
+        source_node_uuid='source_uuid',
+        target_node_uuid='target_uuid',
+        name='KNOWS',
+        group_id='group_1',
+        fact='Alice knows Bob',
+        episodes=[],
+        created_at=now,
+    )
+
+    episode = EpisodicNode(
+        uuid='episode_uuid',
+        name='Episode',
+        group_id='group_1',
+        source='message',
+        source_description='desc',
+        content='Episode content',
+        valid_at=now,
+    )
+
+    await resolve_extracted_edges(
+        clients,
+        [extracted_edge],
+        episode,
+        [
+            EntityNode(uuid='source_uuid', name='Alice', group_id='group_1', labels=[]),
+            EntityNode(uuid='target_uuid', name='Bob', group_id='group_1', labels=[]),
+        ],
+        {},
+        {},
+    )
+
+    assert search_mock.await_count == 1
+    assert search_mock.await_args.kwargs['query_vector'] == [0.5, 0.5]
+    embedder.create.assert_not_awaited()
+    assert [edge.uuid for edge in captured['related']] == [
+        between_edge.uuid,
+        unranked_between_edge.uuid,
+    ]
+    assert [edge.uuid for edge in captured['existing']] == [
+        unrelated_edge.uuid,
+        between_edge.uuid,
+    ]
@@ -16,8 +16,10 @@ from graphiti_core.utils.maintenance.dedup_helpers import (
     _has_high_entropy,
     _hash_shingle,
     _jaccard_similarity,
+    _lsh_band_keys,
     _lsh_bands,
     _minhash_signature,
+    _minhash_signatures,
     _name_entropy,
     _normalize_name_for_fuzzy,
     _normalize_string_exact,
@@ -69,12 +71,12 @@ async def test_resolve_nodes_exact_match_skips_llm(monkeypatch):
     candidate = EntityNode(name='Joe Michaels', group_id='group', labels=['Entity'])
     extracted = EntityNode(name='Joe Michaels', group_id='group', labels=['Entity'])
 
-    async def fake_search(*_, **__):
-        return SearchResults(nodes=[candidate])
+    async def fake_search_many(*_, queries, **__):
+        return [SearchResults(nodes=[candidate]) for _ in queries]
 
     monkeypatch.setattr(
-        'graphiti_core.utils.maintenance.node_operations.search',
-        fake_search,
+        'graphiti_core.utils.maintenance.node_operations.search_many',
+        fake_search_many,
     )
     monkeypatch.setattr(
         'graphiti_core.utils.maintenance.node_operations.filter_existing_duplicate_of_edges',
@@ -109,12 +111,12 @@ async def test_resolve_nodes_low_entropy_uses_llm(monkeypatch):
 
     extracted = EntityNode(name='Joe', group_id='group', labels=['Entity'])
 
-    async def fake_search(*_, **__):
-        return SearchResults(nodes=[])
+    async def fake_search_many(*_, queries, **__):
+        return [SearchResults(nodes=[]) for _ in queries]
 
     monkeypatch.setattr(
-        'graphiti_core.utils.maintenance.node_operations.search',
-        fake_search,
+        'graphiti_core.utils.maintenance.node_operations.search_many',
+        fake_search_many,
     )
     monkeypatch.setattr(
         'graphiti_core.utils.maintenance.node_operations.filter_existing_duplicate_of_edges',
@@ -140,12 +142,12 @@ async def test_resolve_nodes_fuzzy_match(monkeypatch):
     candidate = EntityNode(name='Joe-Michaels', group_id='group', labels=['Entity'])
     extracted = EntityNode(name='Joe Michaels', group_id='group', labels=['Entity'])
 
-    async def fake_search(*_, **__):
-        return SearchResults(nodes=[candidate])
+    async def fake_search_many(*_, queries, **__):
+        return [SearchResults(nodes=[candidate]) for _ in queries]
 
     monkeypatch.setattr(
-        'graphiti_core.utils.maintenance.node_operations.search',
-        fake_search,
+        'graphiti_core.utils.maintenance.node_operations.search_many',
+        fake_search_many,
     )
     monkeypatch.setattr(
         'graphiti_core.utils.maintenance.node_operations.filter_existing_duplicate_of_edges',
@@ -177,9 +179,9 @@ async def test_collect_candidate_nodes_dedupes_and_merges_override(monkeypatch):
     )
     extracted = EntityNode(name='Alice', group_id='group', labels=['Entity'])
 
-    search_mock = AsyncMock(return_value=SearchResults(nodes=[candidate]))
+    search_mock = AsyncMock(return_value=[SearchResults(nodes=[candidate])])
     monkeypatch.setattr(
-        'graphiti_core.utils.maintenance.node_operations.search',
+        'graphiti_core.utils.maintenance.node_operations.search_many',
         search_mock,
     )
 
@@ -206,6 +208,26 @@ def test_build_candidate_indexes_populates_structures():
     assert any(candidate.uuid in bucket for bucket in indexes.lsh_buckets.values())
 
 
+def test_candidate_indexes_incremental_add_and_query():
+    indexes = DedupCandidateIndexes()
+    first = EntityNode(name='Ada Lovelace', group_id='group', labels=['Entity'])
+    second = EntityNode(name='Charles Babbage', group_id='group', labels=['Entity'])
+
+    assert indexes.query(first) is None
+
+    indexes.add(first)
+    indexes.add(second)
+
+    exact_probe = EntityNode(name='  ada   LOVELACE ', group_id='group', labels=['Entity'])
+    fuzzy_probe = EntityNode(name='Ada-Lovelace', group_id='group', labels=['Entity'])
+    low_entropy_probe = EntityNode(name='Ada', group_id='group', labels=['Entity'])
+
+    assert indexes.query(exact_probe) is first
+    assert indexes.query(fuzzy_probe) is first
+    assert indexes.query(low_entropy_probe) is None
+    assert indexes.existing_nodes == [first, second]
+
+
 def test_normalize_helpers():
     assert _normalize_string_exact('  Alice   Smith ') == 'alice smith'
     assert _normalize_name_for_fuzzy('Alice-Smith!') == 'alice smith'
@@ -239,6 +261,22 @@ def test_hash_minhash_and_lsh():
     assert len(hashed) == len(shingles)
 
 
+def test_batched_minhash_matches_single_signatures():
+    shingle_sets = [_shingles('alice smith'), set(), _shingles('alice smyth')]
+    signatures = _minhash_signatures(shingle_sets)
+
+    assert signatures.shape == (3, 32)
+    assert tuple(int(v) for v in signatures[0]) == _minhash_signature(shingle_sets[0])
+    assert tuple(int(v) for v in signatures[2]) == _minhash_signature(shingle_sets[2])
+    assert _minhash_signature(set()) == ()
+
+    band_keys = _lsh_band_keys(signatures)
+    assert band_keys.shape == (3, 8)
+    assert (band_keys[0] == _lsh_band_keys(_minhash_signatures([shingle_sets[0]]))[0]).all()
+    # Identical shingle sets land in identical buckets.
+    assert (_lsh_band_keys(_minhash_signatures([shingle_sets[0]] * 2))[1] == band_keys[0]).all()
+
+
 def test_jaccard_similarity_edges():
     a = {'a', 'b'}
     b = {'a', 'c'}
@@ -1,10 +1,22 @@
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
+from graphiti_core.driver.driver import GraphProvider
 from graphiti_core.nodes import EntityNode
+from graphiti_core.search.search import search_many
+from graphiti_core.search.search_config_recipes import NODE_HYBRID_SEARCH_RRF
 from graphiti_core.search.search_filters import SearchFilters
-from graphiti_core.search.search_utils import hybrid_node_search
+from graphiti_core.graph_queries import get_vector_indices
+from graphiti_core.search.search_utils import (
+    edge_similarity_search,
+    hybrid_node_search,
+    maximal_marginal_relevance,
+    node_fulltext_search_many,
+    node_similarity_search,
+)
 
 
 @pytest.mark.asyncio
@@ -161,3 +173,192 @@ async def test_hybrid_node_search_with_limit_and_duplicates():
         mock_similarity_search.assert_called_with(
             mock_driver, [0.1, 0.2, 0.3], SearchFilters(), ['1'], 4
         )
+
+
+def _entity_record(query_idx: int, uuid: str, name: str) -> dict:
+    return {
+        'query_idx': query_idx,
+        'uuid': uuid,
+        'name': name,
+        'group_id': '1',
+        'labels': ['Entity'],
+        'created_at': '2024-01-01T00:00:00+00:00',
+        'summary': '',
+        'attributes': {},
+    }
+
+
+@pytest.mark.asyncio
+async def test_node_fulltext_search_many_single_round_trip():
+    mock_driver = MagicMock()
+    mock_driver.provider = GraphProvider.NEO4J
+    mock_driver.search_interface = None
+    mock_driver.fulltext_syntax = ''
+    mock_driver.execute_query = AsyncMock(
+        return_value=(
+            [
+                _entity_record(0, '1', 'Alice'),
+                _entity_record(2, '3', 'Charlie'),
+                _entity_record(0, '2', 'Alicia'),
+            ],
+            None,
+            None,
+        )
+    )
+
+    results = await node_fulltext_search_many(
+        mock_driver, ['Alice', 'Bob', 'Charlie'], SearchFilters(), ['1']
+    )
+
+    mock_driver.execute_query.assert_awaited_once()
+    query = mock_driver.execute_query.await_args.args[0]
+    assert 'UNWIND $queries AS q' in query
+    assert [[node.uuid for node in result] for result in results] == [['1', '2'], [], ['3']]
+
+
+def _vector_index_driver(provider: GraphProvider) -> MagicMock:
+    mock_driver = MagicMock()
+    mock_driver.provider = provider
+    mock_driver.search_interface = None
+    mock_driver.vector_index_dimensions = 2
+    mock_driver.ann_index = None
+    mock_driver.execute_query = AsyncMock(return_value=([], None, None))
+    return mock_driver
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'provider, knn_call',
+    [
+        (GraphProvider.NEO4J, "db.index.vector.queryNodes('entity_name_embedding'"),
+        (GraphProvider.FALKORDB, "db.idx.vector.queryNodes('Entity', 'name_embedding'"),
+    ],
+)
+async def test_node_similarity_search_uses_vector_index(provider, knn_call):
+    mock_driver = _vector_index_driver(provider)
+
+    await node_similarity_search(
+        mock_driver, [0.1, 0.2], SearchFilters(node_labels=['Person']), ['g1'], limit=5
+    )
+
+    query = mock_driver.execute_query.await_args.args[0]
+    kwargs = mock_driver.execute_query.await_args.kwargs
+    assert knn_call in query
+    # Group and label predicates are applied to the k-NN candidates, before the limit.
+    assert query.index(knn_call) < query.index('n.group_id IN $group_ids')
+    assert 'n:Person' in query
+    assert kwargs['vector_k'] > kwargs['limit'] == 5
+
+
+@pytest.mark.asyncio
+async def test_edge_similarity_search_uses_vector_index():
+    mock_driver = _vector_index_driver(GraphProvider.NEO4J)
+
+    await edge_similarity_search(mock_driver, [0.1, 0.2], None, None, SearchFilters(), ['g1'])
+
+    query = mock_driver.execute_query.await_args.args[0]
+    assert "db.index.vector.queryRelationships('relates_to_fact_embedding'" in query
+    assert 'e.group_id IN $group_ids' in query
+    assert 'MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)' not in query
+
+
+@pytest.mark.asyncio
+async def test_node_similarity_search_scans_without_vector_index():
+    mock_driver = _vector_index_driver(GraphProvider.NEO4J)
+    mock_driver.vector_index_dimensions = None
+
+    await node_similarity_search(mock_driver, [0.1, 0.2], SearchFilters(), ['g1'])
+
+    query = mock_driver.execute_query.await_args.args[0]
+    assert 'vector.similarity.cosine' in query
+    assert 'queryNodes' not in query
+
+
+def test_get_vector_indices():
+    neo4j_indices = get_vector_indices(GraphProvider.NEO4J, 1024)
+    falkor_indices = get_vector_indices(GraphProvider.FALKORDB, 1024)
+
+    assert len(neo4j_indices) == len(falkor_indices) == 3
+    assert all('`vector.dimensions`: 1024' in query for query in neo4j_indices)
+    assert all('dimension: 1024' in query for query in falkor_indices)
+    assert get_vector_indices(GraphProvider.KUZU, 1024) == []
+
+
+@pytest.mark.asyncio
+async def test_search_many_embeds_once_and_splits_results():
+    embedder = MagicMock()
+    embedder.create = AsyncMock()
+    embedder.create_batch = AsyncMock(return_value=[[0.1, 0.2], [0.3, 0.4]])
+    clients = SimpleNamespace(driver=MagicMock(), embedder=embedder, cross_encoder=MagicMock())
+
+    alice = EntityNode(uuid='1', name='Alice', labels=['Entity'], group_id='1')
+    bob = EntityNode(uuid='2', name='Bob', labels=['Entity'], group_id='1')
+
+    with (
+        patch(
+            'graphiti_core.search.search.node_fulltext_search_many',
+            AsyncMock(return_value=[[alice], [bob]]),
+        ) as mock_fulltext_search_many,
+        patch(
+            'graphiti_core.search.search.node_similarity_search_many',
+            AsyncMock(return_value=[[alice], []]),
+        ) as mock_similarity_search_many,
+        patch('graphiti_core.search.search.node_fulltext_search') as mock_fulltext_search,
+        patch('graphiti_core.search.search.node_similarity_search') as mock_similarity_search,
+    ):
+        results = await search_many(
+            clients,
+            ['Alice', '', 'Bob'],
+            ['1'],
+            NODE_HYBRID_SEARCH_RRF,
+            SearchFilters(),
+        )
+
+    embedder.create_batch.assert_awaited_once_with(['Alice', 'Bob'])
+    embedder.create.assert_not_awaited()
+    mock_fulltext_search_many.assert_awaited_once()
+    mock_similarity_search_many.assert_awaited_once()
+    mock_fulltext_search.assert_not_called()
+    mock_similarity_search.assert_not_called()
+
+    assert len(results) == 3
+    assert [node.uuid for node in results[0].nodes] == ['1']
+    assert results[1].nodes == []
+    assert [node.uuid for node in results[2].nodes] == ['2']
+
+
+def test_maximal_marginal_relevance_scores_against_most_similar_candidate():
+    candidates = {
+        'a': [1.0, 0.0],
+        'a_copy': [0.99, 0.01],
+        'b': [0.0, 2.0],
+    }
+
+    uuids, scores = maximal_marginal_relevance([1.0, 0.0], candidates, mmr_lambda=0.5)
+
+    normalized = {uuid: np.array(v) / np.linalg.norm(v) for uuid, v in candidates.items()}
+    expected = {}
+    for uuid, vector in normalized.items():
+        max_sim = max(
+            [0.0] + [float(vector @ other) for o, other in normalized.items() if o != uuid]
+        )
+        expected[uuid] = 0.5 * vector[0] - 0.5 * max_sim
+
+    assert uuids == sorted(expected, key=lambda uuid: expected[uuid], reverse=True)
+    assert scores == pytest.approx([expected[uuid] for uuid in uuids])
+
+
+def test_maximal_marginal_relevance_greedy_top_k():
+    candidates = {
+        'a': [1.0, 0.0],
+        'a_copy': [0.99, 0.01],
+        'b': [0.6, 0.8],
+    }
+
+    uuids, scores = maximal_marginal_relevance([1.0, 0.0], candidates, mmr_lambda=0.3, top_k=2)
+
+    # The near-duplicate of the first pick is penalized, so the diverse candidate comes second.
+    assert uuids == ['a', 'b']
+    assert scores[0] == pytest.approx(0.3)
+    assert scores[1] == pytest.approx(0.3 * 0.6 - 0.7 * 0.6)
+    assert maximal_marginal_relevance([1.0, 0.0], {}, top_k=2) == ([], [])